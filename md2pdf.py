@@ -1,107 +1,225 @@
 #!/usr/bin/env python3
 """Convert Markdown to PDF using weasyprint."""
 
-import sys
+import argparse
+import io
+import multiprocessing
+import os
+import re
 import markdown
+from markdown.extensions.toc import slugify as toc_slugify
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 
-def convert_md_to_pdf(md_file, pdf_file):
-    with open(md_file, 'r') as f:
-        md_content = f.read()
+_CSS_TEXT = """
+@page {
+    size: letter;
+    margin: 0.75in;
+}
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+    line-height: 1.5;
+    font-size: 11px;
+}
+h1 { color: #1a1a1a; border-bottom: 2px solid #ddd; padding-bottom: 10px; }
+h2 { color: #2a2a2a; border-bottom: 1px solid #eee; padding-bottom: 5px; margin-top: 30px; }
+h3 { color: #3a3a3a; margin-top: 25px; }
+code {
+    background-color: #f4f4f4;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
+    font-size: 12px;
+}
+pre {
+    background-color: #f4f4f4;
+    padding: 15px;
+    border-radius: 5px;
+    font-size: 10px;
+    white-space: pre-wrap;
+}
+pre code {
+    background-color: transparent;
+    padding: 0;
+    overflow-wrap: anywhere;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 20px 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 8px 12px;
+    text-align: left;
+}
+th {
+    background-color: #f4f4f4;
+    font-weight: 600;
+}
+tr:nth-child(even) {
+    background-color: #fafafa;
+}
+blockquote {
+    border-left: 4px solid #ddd;
+    margin: 0;
+    padding-left: 20px;
+    color: #666;
+}
+a {
+    color: #0366d6;
+    text-decoration: none;
+    overflow-wrap: anywhere;
+}
+a:hover {
+    text-decoration: underline;
+}
+p, li, td {
+    overflow-wrap: break-word;
+}
+"""
+
+CHUNK_THRESHOLD = 20 * 1024  # markdown characters before --chunk-by-h1 splits the document
+
+# Opening/closing code fence: up to 3 spaces, then 3+ backticks or tildes
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+# Anchor targets and same-document links in the generated HTML
+ID_ATTR_RE = re.compile(r'\bid="([^"]+)"')
+FRAGMENT_LINK_RE = re.compile(r'\bhref="#([^"]+)"')
+
+# Parsed once at import and reused for every conversion
+_FONT_CONFIG = FontConfiguration()
+_STYLE = CSS(string=_CSS_TEXT, font_config=_FONT_CONFIG)
 
-    # Convert markdown to HTML
+def is_up_to_date(md_file, pdf_file):
+    """PDF is current if newer than both the markdown and this script (which holds the CSS)"""
+    if not os.path.exists(pdf_file):
+        return False
+    source_mtime = max(os.path.getmtime(md_file), os.path.getmtime(__file__))
+    return os.path.getmtime(pdf_file) >= source_mtime
+
+def markdown_to_html(md_content, slugify=toc_slugify):
+    """Convert markdown to a bare HTML document; slugify names the heading ids"""
     html_content = markdown.markdown(
         md_content,
-        extensions=['tables', 'fenced_code', 'codehilite', 'toc']
+        extensions=['tables', 'fenced_code', 'toc'],
+        extension_configs={'toc': {'slugify': slugify}}
     )
 
-    # Wrap in full HTML document with styling
-    full_html = f"""<!DOCTYPE html>
+    # Wrap in a bare HTML document; styling comes from the cached stylesheet
+    return f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <style>
-        @page {{
-            size: letter;
-            margin: 0.75in;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-            line-height: 1.5;
-            font-size: 11px;
-        }}
-        h1 {{ color: #1a1a1a; border-bottom: 2px solid #ddd; padding-bottom: 10px; }}
-        h2 {{ color: #2a2a2a; border-bottom: 1px solid #eee; padding-bottom: 5px; margin-top: 30px; }}
-        h3 {{ color: #3a3a3a; margin-top: 25px; }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
-            font-size: 12px;
-        }}
-        pre {{
-            background-color: #f4f4f4;
-            padding: 15px;
-            border-radius: 5px;
-            font-size: 10px;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            word-break: break-all;
-        }}
-        pre code {{
-            background-color: transparent;
-            padding: 0;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px 12px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f4f4f4;
-            font-weight: 600;
-        }}
-        tr:nth-child(even) {{
-            background-color: #fafafa;
-        }}
-        blockquote {{
-            border-left: 4px solid #ddd;
-            margin: 0;
-            padding-left: 20px;
-            color: #666;
-        }}
-        a {{
-            color: #0366d6;
-            text-decoration: none;
-            word-wrap: break-word;
-            word-break: break-all;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        p, li, td {{
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-        }}
-    </style>
 </head>
 <body>
 {html_content}
 </body>
 </html>"""
 
-    # Convert to PDF
-    HTML(string=full_html).write_pdf(pdf_file)
+def render_html(full_html, target):
+    """Render an HTML document to a PDF file path or file object"""
+    document = HTML(string=full_html).render(stylesheets=[_STYLE], font_config=_FONT_CONFIG)
+    document.write_pdf(target)
+
+def render_markdown(md_content, target):
+    """Render markdown to a PDF file path or file object"""
+    render_html(markdown_to_html(md_content), target)
+
+def _render_chunk(chunk_html):
+    """Pool worker: render one chunk's HTML and return the PDF bytes"""
+    buf = io.BytesIO()
+    render_html(chunk_html, buf)
+    return buf.getvalue()
+
+def unique_slugify():
+    """toc slugify that keeps heading ids unique across separately converted chunks"""
+    seen = set()
+
+    def slugify(value, separator):
+        base = slug = toc_slugify(value, separator)
+        n = 1
+        while slug in seen:
+            slug = f"{base}_{n}"
+            n += 1
+        seen.add(slug)
+        return slug
+    return slugify
+
+def split_by_h1(md_content):
+    """Split markdown before each top-level heading, ignoring '# ' lines inside code fences"""
+    chunks = []
+    current = []
+    fence = None  # marker that opened the current code block, e.g. "````"
+    for line in md_content.splitlines(keepends=True):
+        m = FENCE_RE.match(line)
+        if fence is None:
+            if m:
+                fence = m.group(1)
+            elif line.startswith("# ") and current:
+                chunks.append("".join(current))
+                current = []
+        elif m and m.group(1)[0] == fence[0] and len(m.group(1)) >= len(fence) and not m.group(2).strip():
+            # Only a bare fence of the same character, at least as long, closes it
+            fence = None
+        current.append(line)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+def chunks_are_independent(pages):
+    """False if a chunk's HTML has a [TOC] or links to an anchor in another chunk
+
+    Chunks are rendered as separate documents, so a table of contents would
+    only list its own chunk and WeasyPrint drops links it cannot resolve.
+    """
+    ids = [set(ID_ATTR_RE.findall(page)) for page in pages]
+    all_ids = set().union(*ids)
+    for page, own in zip(pages, ids):
+        if 'class="toc"' in page:
+            return False
+        if any(t in all_ids and t not in own for t in FRAGMENT_LINK_RE.findall(page)):
+            return False
+    return True
+
+def convert_md_to_pdf(md_file, pdf_file, force=False, chunk_by_h1=False):
+    if not force and is_up_to_date(md_file, pdf_file):
+        print(f"{pdf_file} up to date")
+        return
+
+    with open(md_file, 'r') as f:
+        md_content = f.read()
+
+    chunks = split_by_h1(md_content) if chunk_by_h1 and len(md_content) > CHUNK_THRESHOLD else []
+    if len(chunks) > 1:
+        # WeasyPrint is single-threaded: render sections in parallel, then merge.
+        # Markdown is converted here, in order, so heading ids stay unique
+        # across chunks in the merged PDF
+        from pypdf import PdfWriter
+        slugify = unique_slugify()
+        pages = [markdown_to_html(chunk, slugify) for chunk in chunks]
+        if chunks_are_independent(pages):
+            with multiprocessing.Pool() as pool:
+                pdfs = pool.map(_render_chunk, pages)
+            writer = PdfWriter()
+            for data in pdfs:
+                writer.append(io.BytesIO(data))
+            writer.write(pdf_file)
+            print(f"Created {pdf_file} ({len(chunks)} chunks)")
+            return
+        print("Document has a [TOC] or links across top-level sections; rendering it whole")
+
+    render_markdown(md_content, pdf_file)
     print(f"Created {pdf_file}")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print(f"Usage: {sys.argv[0]} input.md output.pdf")
-        sys.exit(1)
-    convert_md_to_pdf(sys.argv[1], sys.argv[2])
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", help="input.md")
+    parser.add_argument("output", help="output.pdf")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the PDF is up to date")
+    parser.add_argument("--chunk-by-h1", action="store_true",
+                        help="render large documents per top-level heading in parallel and merge (needs pypdf); "
+                             "documents with a [TOC] or links between top-level sections are rendered whole, "
+                             "since each section becomes a separate document")
+    args = parser.parse_args()
+    convert_md_to_pdf(args.input, args.output, force=args.force, chunk_by_h1=args.chunk_by_h1)
@@ -6,13 +6,35 @@ GUI to monitor cluster and host status via assisted-installer API
 
 import tkinter as tk
 from tkinter import ttk
+import atexit
+import base64
 import requests
 import json
 import threading
 import time
 import os
+import random
+import re
+import socket
 import subprocess
 import yaml
+from collections import Counter, OrderedDict, defaultdict, deque
+from operator import itemgetter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+
+# Prefer orjson for API payloads and embedded inventory strings
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,15 +42,103 @@ STATE_FILE = os.path.join(SCRIPT_DIR, "gw", ".openshift_install_state.json")
 AGENT_CONFIG_FILE = os.path.join(SCRIPT_DIR, "agent-config.yaml")
 API_URL = "http://192.168.1.201:8090/api/assisted-install/v2"
 REFRESH_INTERVAL = 5000  # ms
+HIDDEN_REFRESH_INTERVAL = 30000  # ms - while the window is minimized
+# Refresh cadence by cluster status (ms) - fast while installing, slow once settled
+REFRESH_INTERVALS = {
+    "preparing-for-installation": 1000,
+    "installing": 1000,
+    "finalizing": 1000,
+    "insufficient": 5000,
+    "pending-for-input": 5000,
+    "installed": 60000,
+    "error": 60000,
+}
+EVENTS_REFRESH_INTERVAL = 5000  # ms - install log events, slower tier than the 1s cluster status
 EVENT_POLL_INTERVAL = 2  # seconds - faster polling for events
+EVENT_POLL_MAX_INTERVAL = 16  # seconds - backoff ceiling while no new events arrive
+SEEN_EVENTS_LIMIT = 4096  # event ids remembered by the streamer
+
+KUBE_API_HOST = "api.gw.lo"
+KUBE_API_PORT = 6443
+KUBE_READY_TTL = 60  # seconds a successful kube API probe is trusted
+KUBE_RETRY_INTERVAL = 5  # seconds before re-probing after a failure
+KUBE_DNS_TTL = 300  # seconds a resolved kube API address list is reused
+OC_COMBINED_RETRY_INTERVAL = 60  # seconds to use split oc gets after the combined one fails
+EVENTS_WAIT = 2.0  # seconds to wait on events after the cluster GET returns
+PARSE_CACHE_SIZE = 256  # hosts whose parsed inventory/validations are kept
+GIB_SHIFT = 30  # bytes >> GIB_SHIFT == whole GiB
+INSTALL_TAB = 2  # notebook index of the Installation tab
+INSTALL_LOG_LINES = 50  # events kept in the Installation tab
+# Output-only Text panes: no undo history, read-only outside _write_text
+READONLY_TEXT_OPTS = {"wrap": tk.WORD, "undo": False, "autoseparators": False, "maxundo": 0,
+                      "state": tk.DISABLED}
+DONE_EVENT_RE = re.compile(r"Done|installed")
+ERROR_EVENT_RE = re.compile(r"error", re.IGNORECASE)
+
+# Cluster statuses that show the installation event log
+INSTALL_LOG_STATUSES = ("preparing-for-installation", "installing", "finalizing", "installed")
+
+DEFAULT_STATUS_COLOR = "#555555"
+STATUS_COLORS = MappingProxyType({
+    "ready": "#2d7d2d",
+    "installed": "#2d7d2d",
+    "done": "#2d7d2d",
+    "installing": "#4a6fa5",
+    "installing-in-progress": "#4a6fa5",
+    "preparing-for-installation": "#4a6fa5",
+    "preparing-successful": "#4a6fa5",
+    "finalizing": "#4a6fa5",
+    "pending-for-input": "#8b7355",
+    "installing-pending-user-action": "#8b7355",
+    "insufficient": "#8b7355",
+    "rebooting": "#6b5b7a",
+    "error": "#a05050",
+    "known": "#2d7d2d",
+    # Neutral, but listed so their tags are configured up front too
+    "discovering": DEFAULT_STATUS_COLOR,
+    "unknown": DEFAULT_STATUS_COLOR,
+})
+
+# Validation check status -> marker shown in the Summary and Validations panes
+VALIDATION_SYMBOLS = MappingProxyType({"success": "✓", "failure": "✗", "error": "!", "pending": "○"})
 
 LOG_FILE = "/tmp/monitor-debug.log"
 EVENT_FILE = "/tmp/monitor-events.log"
 DEBUG_CHECK_INTERVAL = 30000  # ms - debug checks every 30 seconds
+DEBUG_CHECK_TIMEOUT = 20  # seconds - overall bound on one round of node checks
+SSH_CONTROL_DIR = os.path.expanduser("~/.ssh")
+# Multiplex checks over one persistent connection per node, kept for two check
+# intervals; keepalives drop a master whose node rebooted mid-install
 SSH_OPTS = ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "LogLevel=ERROR", "-o", "ConnectTimeout=5"]
+            "-o", "LogLevel=ERROR", "-o", "ConnectTimeout=5",
+            "-o", "ControlMaster=auto", "-o", f"ControlPath={SSH_CONTROL_DIR}/cm-%C",
+            "-o", f"ControlPersist={2 * DEBUG_CHECK_INTERVAL // 1000}s",
+            "-o", "ServerAliveInterval=5", "-o", "ServerAliveCountMax=2"]
 GATHERDEBUG_SCRIPT = os.path.join(SCRIPT_DIR, "gatherdebug.sh")
 
+# Node journal lines worth surfacing in the debug tab
+JOURNAL_ISSUES_RE = ("x509|certificate.*unknown|crypto.*verification|ErrImagePull|ImagePullBackOff"
+                     "|manifest unknown|OOMKill|No space left")
+
+# oc output limited to the fields the cluster checks read, one tab-separated row per item
+CSR_CONDITIONS_JSONPATH = r'jsonpath={range .items[*]}{.metadata.name}{"\t"}{.status.conditions[*].type}{"\n"}{end}'
+_MC_ANNOTATION = r"{.metadata.annotations.machineconfiguration\.openshift\.io/%s}"
+NODE_MC_JSONPATH = (r'jsonpath={range .items[*]}{.metadata.name}{"\t"}'
+                    + r'{"\t"}'.join(_MC_ANNOTATION % k for k in ("currentConfig", "desiredConfig", "state"))
+                    + r'{"\n"}{end}')
+
+# "===NAME===" markers echoed between SSH_CHECK_CMD sections
+SECTION_HEADER_RE = re.compile(r"===(\w+)===$")
+
+# Use% and mount point at the end of a df -h row
+DF_USE_RE = re.compile(r"(\d+)%(?:\s+(\S+))?\s*$")
+
+# Buckets for the journal lines above, checked in order
+ISSUE_CLASSES = (
+    ("cert", re.compile(r"x509|certificate|crypto", re.I)),
+    ("pull", re.compile(r"errimagepull|imagepullbackoff|manifest unknown", re.I)),
+)
+
 # Single SSH command to collect all debug info from a node
 SSH_CHECK_CMD = '; '.join([
     'echo "===KUBELET==="',
@@ -36,9 +146,12 @@ SSH_CHECK_CMD = '; '.join([
     'echo "===CRIO==="',
     'systemctl is-active crio 2>/dev/null || echo inactive',
     'echo "===ISSUES==="',
-    'sudo journalctl --no-pager -n 1000 -q 2>&1 | grep -iE '
-    '"x509|certificate.*unknown|crypto.*verification|ErrImagePull|ImagePullBackOff'
-    '|manifest unknown|OOMKill|No space left" | tail -10',
+    # Filter inside journald; fall back to grep where journalctl lacks --grep.
+    # Probe for the option rather than use the exit status: journalctl -g
+    # exits non-zero when nothing matches, i.e. on every healthy node
+    f'(if journalctl --help 2>/dev/null | grep -q -- --grep; then'
+    f' sudo journalctl --no-pager -q --since=-10min --case-sensitive=false -g "{JOURNAL_ISSUES_RE}" 2>/dev/null;'
+    f' else sudo journalctl --no-pager -q --since=-10min 2>&1 | grep -iE "{JOURNAL_ISSUES_RE}"; fi) | tail -10',
     'echo "===MC==="',
     "python3 -c \"import json; d=json.load(open('/etc/machine-config-daemon/currentconfig'));"
     " print(d['metadata']['name'])\" 2>/dev/null || echo not-found",
@@ -51,11 +164,21 @@ SSH_CHECK_CMD = '; '.join([
     'echo "===END==="',
 ])
 
+_log_files = {}  # path -> line-buffered append handle
+_log_lock = threading.Lock()
+
+def _append_line(path, line):
+    """Append a line through a handle kept open for the session (flushed per line)"""
+    with _log_lock:
+        f = _log_files.get(path)
+        if f is None:
+            f = _log_files[path] = open(path, "a", buffering=1)
+            atexit.register(f.close)
+        f.write(line + "\n")
+
 def log(msg):
     """Debug logging to file"""
-    with open(LOG_FILE, "a") as f:
-        f.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
-        f.flush()
+    _append_line(LOG_FILE, f"[{time.strftime('%H:%M:%S')}] {msg}")
 
 def log_event(msg, severity="info"):
     """Log event to event file and print to console"""
@@ -63,20 +186,114 @@ def log_event(msg, severity="info"):
     prefix = {"error": "ERR", "warning": "WRN", "info": "   ", "critical": "CRT"}.get(severity, "   ")
     line = f"[{timestamp}] {prefix} {msg}"
     print(line, flush=True)
-    with open(EVENT_FILE, "a") as f:
-        f.write(line + "\n")
-        f.flush()
+    _append_line(EVENT_FILE, line)
+
+def classify_issue(line):
+    """Bucket a journal issue line as cert, pull or other"""
+    for name, pattern in ISSUE_CLASSES:
+        if pattern.search(line):
+            return name
+    return "other"
+
+CONDITION_TYPES = ("Ready", "Available", "Progressing", "Degraded")
+
+# Operators that roll out to control plane nodes
+CONTROL_PLANE_OPERATORS = frozenset({
+    "etcd", "kube-apiserver", "kube-controller-manager", "kube-scheduler",
+    "openshift-apiserver", "authentication", "openshift-controller-manager",
+})
+
+def node_role(node):
+    """master, worker or unknown from the node's role labels, memoized on the node dict"""
+    role = node.get("_role")
+    if role is None:
+        labels = node.get("metadata", {}).get("labels", {})
+        if "node-role.kubernetes.io/master" in labels or "node-role.kubernetes.io/control-plane" in labels:
+            role = "master"
+        elif "node-role.kubernetes.io/worker" in labels:
+            role = "worker"
+        else:
+            role = "unknown"
+        node["_role"] = role
+    return role
+
+def is_master(node):
+    """True for nodes carrying the master or control-plane role label"""
+    return node_role(node) == "master"
+
+def node_sort_key(node):
+    """Masters first, then workers, each by name"""
+    return (0 if is_master(node) else 1, node.get("metadata", {}).get("name", ""))
+
+def index_conditions(items):
+    """Scan each oc item's conditions once: name -> {type: is_true, "message", "problem_message"}
+
+    "message" is the first Progressing message; "problem_message" is the first
+    Progressing message or message of a true Degraded condition.
+    """
+    index = {}
+    for item in items:
+        entry = {"Ready": False, "Available": False, "Progressing": False, "Degraded": False,
+                 "message": "", "problem_message": ""}
+        for c in item.get("status", {}).get("conditions", []):
+            get = c.get
+            ctype = get("type")
+            is_true = get("status") == "True"
+            if is_true and ctype in CONDITION_TYPES:
+                entry[ctype] = True
+            msg = get("message")
+            if msg:
+                if ctype == "Progressing":
+                    if not entry["message"]:
+                        entry["message"] = msg
+                    if not entry["problem_message"]:
+                        entry["problem_message"] = msg
+                elif ctype == "Degraded" and is_true and not entry["problem_message"]:
+                    entry["problem_message"] = msg
+        index[item.get("metadata", {}).get("name", "")] = entry
+    return index
+
+_token_cache = {"mtime": 0, "token": ""}
+_token_lock = threading.Lock()  # refresh worker and event streamer both read the token
 
 def get_auth_token():
-    """Read auth token from state file"""
-    try:
-        with open(STATE_FILE, 'r') as f:
-            state = json.load(f)
+    """Read auth token from state file, re-parsing only when the file changes"""
+    with _token_lock:
+        try:
+            mtime = os.stat(STATE_FILE).st_mtime_ns
+            if mtime == _token_cache["mtime"]:
+                return _token_cache["token"]
+            with open(STATE_FILE, 'rb') as f:
+                state = json_loads(f.read())
             token = state.get("*gencrypto.AuthConfig", {}).get("UserAuthToken", "")
+            _token_cache["mtime"] = mtime
+            _token_cache["token"] = token
             return token
-    except Exception as e:
-        log(f"Token error: {e}")
-        return ""
+        except (OSError, ValueError) as e:
+            log(f"Token error: {e}")
+            return ""
+
+
+def token_expiry(token):
+    """Expiry (epoch seconds) from a JWT auth token's exp claim, 0 if it has none"""
+    try:
+        payload = token.split(".")[1]
+        claims = json_loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return int(claims.get("exp", 0))
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+_agent_config_cache = {"mtime": 0, "config": None}
+
+def load_agent_config():
+    """Parse agent-config.yaml, reusing the last parse while the file is unchanged"""
+    mtime = os.stat(AGENT_CONFIG_FILE).st_mtime_ns
+    if mtime != _agent_config_cache["mtime"]:
+        with open(AGENT_CONFIG_FILE, 'rb') as f:
+            _agent_config_cache["config"] = yaml.load(f, Loader=YamlLoader) or {}
+        _agent_config_cache["mtime"] = mtime
+    return _agent_config_cache["config"]
 
 
 class AgentMonitor:
@@ -92,12 +309,72 @@ class AgentMonitor:
         self.api_success_count = 0
         self.switched_to_install = False
         self.selected_host_id = None
-        self.seen_event_ids = set()
+        self._details_host = None  # host dict currently drawn in details_text
+        self.last_status = None
+        self._tree_rows = {}  # hosts_tree iid -> (values, tag) as last rendered
+        self._tree_order = []  # hosts_tree iids in display order
+        self._configured_tags = set()
+        # Parsed host JSON blobs: host_id -> (hash of raw string, parsed dict)
+        self._inv_cache = OrderedDict()  # host id -> (raw hash, parsed), LRU
+        self._validations_cache = OrderedDict()
+        # Both caches are used from the refresh worker and the Tk thread
+        self._parse_lock = threading.Lock()
+        # Event ids already written to EVENT_FILE, least recently listed first
+        self.seen_event_ids = OrderedDict()
         self.event_streamer_running = False
 
+        # Keep-alive HTTP session shared by all API polls
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+        self.session.mount("http://", adapter)
+        if API_URL.startswith("https://"):
+            # Installer endpoints use self-signed certs: decide verification
+            # once on the session and silence the per-request warning
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            self.session.mount("https://", adapter)
+            self.session.verify = False
+        self.session.headers.update({"Connection": "keep-alive"})
+        self.session.stream = False
+        self._token = None
+        self._token_expires = 0  # JWT exp of _token, 0 if unknown
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self._events_future = None  # in-flight get_events, carried across ticks if slow
+        self._events_due = 0  # monotonic time of the next events fetch
+        self._oc_join_due = 0  # monotonic time of the next kube API / node-join probe
+        # kube API probe: resolved (ip, port) list and monotonic deadlines
+        self._kube_addrs = []
+        self._kube_addrs_expire = 0
+        self._kube_ready_until = 0
+        self._kube_retry_at = 0
+        # Persistent refresh worker; _polling is set while a refresh is in flight
+        self._tick = threading.Event()
+        self._polling = threading.Event()
+        threading.Thread(target=self._refresh_worker, name="refresh-worker", daemon=True).start()
+        self._refresh_after_id = None
+        self._hidden_polling = False
+        # Conditional GET state: endpoint -> ETag / Last-Modified, endpoint -> (body hash, payload)
+        self._etags = {}
+        self._last_modified = {}
+        self._responses = {}
+        self._last_cluster = None
+        self._last_hosts = None
+        self._last_events = None
+        self._oc_results = {}  # oc resource -> (stdout hash, items)
+        self._oc_split = (None, [], [])  # combined items -> (nodes, operators)
+        self._oc_combined_retry_at = 0  # monotonic time to try the combined oc get again
+        self._last_nodes = None
+        self._last_operators = None
+        self._sorted_events = (None, [])  # raw events payload -> oldest-first copy
+        self._install_log_keys = deque(maxlen=INSTALL_LOG_LINES)  # events shown in install_text
+        self._pending_install_log = None  # (method, args) held while the Installation tab is hidden
+        self._text_written = {}  # Text widget -> insert arguments of its last full rewrite
+        self._install_lines = 0  # newline-terminated lines currently in install_text
+
         # Load hostname mappings from agent-config.yaml
         self.hostname_by_mac = {}
         self.hostname_by_role = {"master": [], "worker": []}
+        self._agent_config_mtime = 0  # agent-config.yaml mtime the mappings were built from
         self._load_agent_config()
 
         # Debug state
@@ -106,6 +383,9 @@ class AgentMonitor:
         self.debug_findings = {}
         self.debug_checking = False
         self.last_debug_check = None
+        # One worker per node plus the two cluster-level oc checks, so no
+        # check queues behind another within the round's timeout
+        self._debug_pool = ThreadPoolExecutor(max_workers=len(self.node_ips) + 2)
 
         # Clear logs and write startup info
         with open(LOG_FILE, "w") as f:
@@ -169,17 +449,23 @@ class AgentMonitor:
         self.hosts_tree.column("progress", width=200)
 
         self.hosts_tree.pack(fill=tk.BOTH, expand=True)
+
+        # Configure status colors once; unknown statuses are added lazily
+        for status, color in STATUS_COLORS.items():
+            self.hosts_tree.tag_configure(status, foreground=color)
+        self._configured_tags.update(STATUS_COLORS)
         self.hosts_tree.bind("<<TreeviewSelect>>", self.on_host_select)
 
         # Tabbed details section
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Summary tab (all failing validations)
         summary_frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(summary_frame, text="Summary")
 
-        self.summary_text = tk.Text(summary_frame, height=15, wrap=tk.WORD)
+        self.summary_text = tk.Text(summary_frame, height=15, **READONLY_TEXT_OPTS)
         summary_scrollbar = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL, command=self.summary_text.yview)
         self.summary_text.configure(yscrollcommand=summary_scrollbar.set)
         self.summary_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -190,12 +476,13 @@ class AgentMonitor:
         self.summary_text.tag_configure("failure", foreground="#a05050")
         self.summary_text.tag_configure("error", foreground="#8b7355")
         self.summary_text.tag_configure("success", foreground="#2d7d2d")
+        self.summary_text.tag_configure("pending", foreground="#777777")
 
         # Validation tab (selected host details)
         validation_frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(validation_frame, text="Validation")
 
-        self.details_text = tk.Text(validation_frame, height=15, wrap=tk.WORD)
+        self.details_text = tk.Text(validation_frame, height=15, **READONLY_TEXT_OPTS)
         scrollbar = ttk.Scrollbar(validation_frame, orient=tk.VERTICAL, command=self.details_text.yview)
         self.details_text.configure(yscrollcommand=scrollbar.set)
         self.details_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -211,7 +498,7 @@ class AgentMonitor:
         install_frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(install_frame, text="Installation")
 
-        self.install_text = tk.Text(install_frame, height=15, wrap=tk.WORD)
+        self.install_text = tk.Text(install_frame, height=15, **READONLY_TEXT_OPTS)
         install_scrollbar = ttk.Scrollbar(install_frame, orient=tk.VERTICAL, command=self.install_text.yview)
         self.install_text.configure(yscrollcommand=install_scrollbar.set)
         self.install_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -242,7 +529,7 @@ class AgentMonitor:
         self.debug_status_label = ttk.Label(debug_btn_frame, text="")
         self.debug_status_label.pack(side=tk.RIGHT, padx=5)
 
-        self.debug_text = tk.Text(debug_frame, height=15, wrap=tk.WORD)
+        self.debug_text = tk.Text(debug_frame, height=15, **READONLY_TEXT_OPTS)
         debug_scrollbar = ttk.Scrollbar(debug_frame, orient=tk.VERTICAL,
                                         command=self.debug_text.yview)
         self.debug_text.configure(yscrollcommand=debug_scrollbar.set)
@@ -267,23 +554,82 @@ class AgentMonitor:
         self.status_label = ttk.Label(btn_frame, text="")
         self.status_label.pack(side=tk.LEFT, padx=20)
 
+        # Catch up immediately when restored from minimized (slow polling)
+        self.root.bind("<Map>", self._on_map)
+
+    def _on_map(self, event):
+        # Toplevel bindings also fire for every child widget being mapped
+        if event.widget is self.root and self._hidden_polling:
+            self._hidden_polling = False
+            self.refresh()
+
+    def _load_token(self):
+        """Read auth token and keep it until rejected or near expiry"""
+        self._token = get_auth_token() or None
+        self._token_expires = token_expiry(self._token) if self._token else 0
+        return self._token
+
+    def _invalidate_token(self):
+        """Forget a rejected token so the state file is re-read, even with the same mtime"""
+        self._token = None
+        with _token_lock:
+            _token_cache["mtime"] = 0
+
+    def _current_token(self):
+        """Cached token, re-read from the state file when missing or about to expire"""
+        if self._token and (not self._token_expires or time.time() < self._token_expires - 60):
+            return self._token
+        return self._load_token()
+
     def api_request(self, endpoint):
         try:
-            token = get_auth_token()
+            token = self._current_token()
             if not token:
                 log(f"API {endpoint}: no token")
                 return "no_token"
+            # Per-request auth: the session is shared across threads, so its
+            # own headers stay fixed after __init__
             headers = {"Authorization": token}
-            response = requests.get(f"{API_URL}{endpoint}", headers=headers, timeout=5, verify=False)
+            etag = self._etags.get(endpoint)
+            if etag:
+                headers["If-None-Match"] = etag
+            last_modified = self._last_modified.get(endpoint)
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            response = self.session.get(f"{API_URL}{endpoint}", headers=headers, timeout=5,
+                                        allow_redirects=False)
             log(f"API {endpoint}: {response.status_code}")
+            cached = self._responses.get(endpoint)
+            if response.status_code == 304 and cached:
+                return cached[1]
             if response.status_code == 200:
-                return response.json()
+                if response.headers.get("ETag"):
+                    self._etags[endpoint] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    self._last_modified[endpoint] = response.headers["Last-Modified"]
+                # Same body as last poll: hand back the same object so callers
+                # can skip re-rendering by identity
+                digest = hash(response.content)
+                if cached and cached[0] == digest:
+                    return cached[1]
+                data = json_loads(response.content)
+                self._responses[endpoint] = (digest, data)
+                return data
+            if response.status_code == 401:
+                # Token rotated (new install) - re-read state file next time
+                self._invalidate_token()
             return None
         except Exception as e:
             log(f"API {endpoint}: error {e}")
             return None
 
     def get_cluster(self):
+        # Known cluster: one GET returns the cluster with its hosts embedded
+        if self.cluster_id:
+            cluster = self.api_request(f"/clusters/{self.cluster_id}")
+            if cluster == "no_token" or (cluster and isinstance(cluster, dict)):
+                return cluster
+        # First tick, or the cluster is gone: discover it from the list
         clusters = self.api_request("/clusters")
         if clusters == "no_token":
             return "no_token"
@@ -308,37 +654,61 @@ class AgentMonitor:
             inv = h.get('inventory', '')
             if inv:
                 try:
-                    inv_data = json.loads(inv)
+                    inv_data = self._parsed_inventory(h)
                     log(f"inventory.hostname: {inv_data.get('hostname')}")
-                except:
+                except (ValueError, TypeError, AttributeError):
                     log(f"inventory parse failed")
         return hosts
 
-    def get_events(self, cluster_id):
-        return self.api_request(f"/events?cluster_id={cluster_id}") or []
+    def get_events(self, cluster_id, limit=INSTALL_LOG_LINES):
+        """Fetch the newest events, returned oldest first"""
+        events = self.api_request(
+            f"/events?cluster_id={cluster_id}&limit={limit}&order=descending") or []
+        # Sort once per new payload so unchanged responses keep their identity
+        if self._sorted_events[0] is not events:
+            self._sorted_events = (events, sorted(events, key=lambda e: e.get("event_time", "")))
+        return self._sorted_events[1]
 
     def kube_api_reachable(self):
-        """Check if kube API port is reachable (fast TCP check)"""
-        import socket
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('api.gw.lo', 6443))
-            sock.close()
-            return result == 0
-        except:
+        """Check if kube API port is reachable (fast TCP check), trusting a success for a while"""
+        now = time.monotonic()
+        if now < self._kube_ready_until:
+            return True
+        if now < self._kube_retry_at:
             return False
+        reachable = False
+        try:
+            # Re-resolve only every KUBE_DNS_TTL; connecting to the literal
+            # address skips the resolver on each probe
+            if now >= self._kube_addrs_expire:
+                self._kube_addrs = [info[4][:2] for info in socket.getaddrinfo(
+                    KUBE_API_HOST, KUBE_API_PORT, proto=socket.IPPROTO_TCP)]
+                self._kube_addrs_expire = now + KUBE_DNS_TTL
+            for addr in self._kube_addrs:
+                try:
+                    socket.create_connection(addr, timeout=1).close()
+                    reachable = True
+                    break
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        if reachable:
+            self._kube_ready_until = now + KUBE_READY_TTL
+        else:
+            self._kube_retry_at = now + KUBE_RETRY_INTERVAL
+        return reachable
 
     def get_oc_nodes(self):
         """Get nodes via oc command"""
         try:
             result = subprocess.run(
                 ["oc", "get", "nodes", "-o", "json"],
-                capture_output=True, text=True, timeout=10
+                capture_output=True, timeout=10
             )
             if result.returncode == 0:
-                return json.loads(result.stdout).get("items", [])
-        except:
+                return self._parse_oc_items("nodes", result.stdout)
+        except (subprocess.SubprocessError, OSError, ValueError):
             pass
         return []
 
@@ -347,137 +717,278 @@ class AgentMonitor:
         try:
             result = subprocess.run(
                 ["oc", "get", "co", "-o", "json"],
-                capture_output=True, text=True, timeout=10
+                capture_output=True, timeout=10
             )
             if result.returncode == 0:
-                return json.loads(result.stdout).get("items", [])
-        except:
+                return self._parse_oc_items("operators", result.stdout)
+        except (subprocess.SubprocessError, OSError, ValueError):
             pass
         return []
 
+    def get_oc_nodes_and_operators(self):
+        """Get nodes and cluster operators with a single oc call"""
+        now = time.monotonic()
+        if now >= self._oc_combined_retry_at:
+            try:
+                result = subprocess.run(
+                    ["oc", "get", "nodes,clusteroperators", "-o", "json"],
+                    capture_output=True, timeout=10
+                )
+                if result.returncode == 0:
+                    items = self._parse_oc_items("nodes,clusteroperators", result.stdout)
+                    if self._oc_split[0] is not items:
+                        nodes = [i for i in items if i.get("kind") == "Node"]
+                        operators = [i for i in items if i.get("kind") == "ClusterOperator"]
+                        self._oc_split = (items, nodes, operators)
+                    return self._oc_split[1], self._oc_split[2]
+            except (subprocess.SubprocessError, OSError, ValueError):
+                pass
+            # Stick with the split gets for a while instead of paying for a
+            # failing combined call on top of them every tick
+            log(f"Combined oc get failed, using separate gets for {OC_COMBINED_RETRY_INTERVAL}s")
+            self._oc_combined_retry_at = now + OC_COMBINED_RETRY_INTERVAL
+        # One resource type may not be served yet - fetch them separately
+        return self.get_oc_nodes(), self.get_oc_operators()
+
+    def _parse_oc_items(self, key, stdout):
+        """Parse oc JSON output (raw bytes), returning the previous list object when output is unchanged"""
+        digest = hash(stdout)
+        cached = self._oc_results.get(key)
+        if cached and cached[0] == digest:
+            return cached[1]
+        items = json_loads(stdout).get("items", [])
+        self._oc_results[key] = (digest, items)
+        return items
+
     def refresh(self):
+        # Manual Refresh button and the timer share one schedule
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+        if self._polling.is_set():
+            log("Refresh skipped, previous refresh still running")
+            self._refresh_after_id = self.root.after(self._next_refresh_interval(), self.refresh)
+            return
         log(f"Refresh called, mode={self.mode}")
-        def do_refresh():
-            if self.mode == "api":
-                cluster = self.get_cluster()
-
-                if cluster == "no_token":
-                    self.root.after(0, lambda: self.cluster_status.config(
-                        text="NO TOKEN",
-                        foreground="#8b7355"
-                    ))
-                    self.root.after(0, lambda: self.status_label.config(
-                        text="Waiting for state file..."
-                    ))
-                elif cluster:
-                    self.api_fail_count = 0
-                    self.api_success_count += 1
-                    self.cluster_id = cluster.get("id")
-                    self.infra_env_id = cluster.get("infra_env_id")
-                    status = cluster.get("status", "unknown")
-                    status_info = cluster.get("status_info", "")
-                    progress = cluster.get("progress", {})
-                    total_pct = progress.get("total_percentage", 0)
-
-                    # Update cluster status with percentage
-                    if total_pct > 0:
-                        status_text = f"{status.upper()} ({total_pct}%)"
-                    else:
-                        status_text = status.upper()
-
-                    log(f"Updating GUI: status={status_text}")
-                    self.root.after(0, lambda t=status_text, s=status: self.cluster_status.config(
-                        text=t,
-                        foreground=self.status_color(s)
-                    ))
-                    self.root.after(0, lambda si=status_info: self.cluster_info.config(text=si))
-
-                    # Update progress bar
-                    self.root.after(0, lambda p=total_pct: self.progress_bar.config(value=p))
-                    self.root.after(0, lambda p=total_pct: self.progress_label.config(text=f"{p}%"))
-
-                    # Get hosts
-                    hosts = self.get_hosts(self.cluster_id)
-                    self.root.after(0, lambda h=hosts: self.update_hosts(h))
-
-                    # Switch to install tab and update install log when installing
-                    if status in ("preparing-for-installation", "installing", "finalizing") and not self.switched_to_install:
-                        self.root.after(0, lambda: self.notebook.select(2))  # Installation tab is index 2
-                        self.switched_to_install = True
-
-                    if status in ("preparing-for-installation", "installing", "finalizing", "installed"):
-                        events = self.get_events(self.cluster_id)
-                        self.root.after(0, lambda e=events: self.update_install_log(e))
-
-                    # Switch to oc mode when kube API is reachable AND all nodes have joined
-                    if self.kube_api_reachable():
-                        nodes = self.get_oc_nodes()
-                        expected_nodes = len(self.hostname_by_mac)  # From agent-config
-                        if len(nodes) >= expected_nodes and expected_nodes > 0:
-                            self.mode = "oc"
-                            log(f"Switching to oc mode ({len(nodes)}/{expected_nodes} nodes joined)")
-
-                    self.root.after(0, lambda: self.status_label.config(
-                        text=f"Last update: {time.strftime('%H:%M:%S')}"
-                    ))
-                    self.root.after(0, lambda: self.root.update_idletasks())
-                else:
-                    self.api_fail_count += 1
-                    # Only switch to oc mode if API was working before (bootstrap complete)
-                    # api_success_count > 0 means we connected at least once
-                    if self.api_fail_count >= 3 and self.api_success_count > 5:
-                        self.mode = "oc"
-                        log("Switching to oc mode (API was up, now down = bootstrap complete)")
-                        self.root.after(0, lambda: self.cluster_info.config(
-                            text="Switched to cluster monitoring (bootstrap complete)"
-                        ))
-                    else:
-                        self.root.after(0, lambda: self.cluster_status.config(
-                            text="WAITING...",
-                            foreground="#8b7355"
-                        ))
-                        self.root.after(0, lambda: self.status_label.config(
-                            text=f"Waiting on API... ({self.api_fail_count})"
-                        ))
-
-            if self.mode == "oc":
-                self.refresh_oc_mode()
+        self._polling.set()
+        self._tick.set()
 
-        # Run in background thread with error handling
-        def safe_refresh():
+        # Schedule next refresh
+        interval = self._next_refresh_interval()
+        self._hidden_polling = self._window_hidden()
+        self._refresh_after_id = self.root.after(interval, self.refresh)
+
+    def _refresh_worker(self):
+        """Long-lived refresh thread, woken by refresh() through the _tick event"""
+        while True:
+            self._tick.wait()
+            self._tick.clear()
             try:
-                do_refresh()
+                self._do_refresh()
             except Exception as e:
                 print(f"Refresh error: {e}")
-        threading.Thread(target=safe_refresh, daemon=True).start()
+            finally:
+                self._polling.clear()
+
+    def _do_refresh(self):
+        snap = {}  # UI changes for this tick, applied in one Tk callback
+        if self.mode == "api":
+            # While installing, fetch events alongside the cluster on their own
+            # slower cadence; a request still running from an earlier tick is
+            # reused, not duplicated
+            events_due = time.monotonic() >= self._events_due
+            if self.cluster_id and self.last_status in INSTALL_LOG_STATUSES and events_due:
+                if self._events_future is None or self._events_future.done():
+                    self._events_future = self.executor.submit(self.get_events, self.cluster_id)
+            elif self.last_status not in INSTALL_LOG_STATUSES:
+                self._events_future = None
+            cluster = self.get_cluster()
+
+            if cluster == "no_token":
+                snap["status_text"] = "NO TOKEN"
+                snap["status_fg"] = "#8b7355"
+                snap["status_label"] = "Waiting for state file..."
+            elif cluster:
+                self.api_fail_count = 0
+                self.api_success_count += 1
+                if cluster.get("id") != self.cluster_id:
+                    # Cluster changed, prefetched events and parsed host JSON are stale
+                    self._events_future = None
+                    with self._parse_lock:
+                        self._inv_cache.clear()
+                        self._validations_cache.clear()
+                    # The install log is appended to incrementally; start it over
+                    snap["reset_install_log"] = True
+                self.cluster_id = cluster.get("id")
+                self.infra_env_id = cluster.get("infra_env_id")
+                status = cluster.get("status", "unknown")
+                self.last_status = status
+                status_info = cluster.get("status_info", "")
+                progress = cluster.get("progress", {})
+                total_pct = progress.get("total_percentage", 0)
+
+                # Update cluster status with percentage
+                if total_pct > 0:
+                    status_text = f"{status.upper()} ({total_pct}%)"
+                else:
+                    status_text = status.upper()
 
-        # Schedule next refresh
-        self.root.after(REFRESH_INTERVAL, self.refresh)
+                # Skip label updates when the API returned the same cluster payload
+                if cluster is not self._last_cluster:
+                    self._last_cluster = cluster
+                    log(f"Updating GUI: status={status_text}")
+                    snap["status_text"] = status_text
+                    snap["status_fg"] = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
+                    snap["info"] = status_info
+                    snap["pct"] = total_pct
+
+                # Hosts come embedded in /clusters/{id}; fall back to the hosts
+                # endpoints on the first (list) tick, before hosts bind, or while
+                # the infra-env hosts carry requested_hostname and these don't
+                hosts = cluster.get("hosts")
+                if not hosts or (self.infra_env_id and not hosts[0].get("requested_hostname")):
+                    hosts = self.get_hosts(self.cluster_id)
+                if hosts is not self._last_hosts:
+                    self._last_hosts = hosts
+                    snap["hosts"] = hosts
+
+                # Switch to install tab and update install log when installing
+                if status in ("preparing-for-installation", "installing", "finalizing") and not self.switched_to_install:
+                    snap["tab"] = INSTALL_TAB
+                    self.switched_to_install = True
+
+                if status in INSTALL_LOG_STATUSES and events_due:
+                    self._events_due = time.monotonic() + EVENTS_REFRESH_INTERVAL / 1000
+                    if self._events_future is None:
+                        self._events_future = self.executor.submit(self.get_events, self.cluster_id)
+                    try:
+                        events = self._events_future.result(timeout=EVENTS_WAIT)
+                    except FuturesTimeout:
+                        log("Events request still pending, keeping current install log")
+                        events = self._last_events
+                    if events is not self._last_events:
+                        self._last_events = events
+                        snap["events"] = events
+
+                # Switch to oc mode when kube API is reachable AND all nodes have joined.
+                # Probed on the default cadence, not the faster installing one, so
+                # a live API doesn't mean an oc fork every tick
+                now = time.monotonic()
+                if now >= self._oc_join_due and self.kube_api_reachable():
+                    self._oc_join_due = now + REFRESH_INTERVAL / 1000
+                    nodes = self.get_oc_nodes()
+                    expected_nodes = len(self.hostname_by_mac)  # From agent-config
+                    if len(nodes) >= expected_nodes and expected_nodes > 0:
+                        self.mode = "oc"
+                        log(f"Switching to oc mode ({len(nodes)}/{expected_nodes} nodes joined)")
+
+                snap["status_label"] = f"Last update: {time.strftime('%H:%M:%S')}"
+            else:
+                self.api_fail_count += 1
+                # Only switch to oc mode if API was working before (bootstrap complete)
+                # api_success_count > 0 means we connected at least once
+                if self.api_fail_count >= 3 and self.api_success_count > 5:
+                    self.mode = "oc"
+                    log("Switching to oc mode (API was up, now down = bootstrap complete)")
+                    snap["info"] = "Switched to cluster monitoring (bootstrap complete)"
+                else:
+                    snap["status_text"] = "WAITING..."
+                    snap["status_fg"] = "#8b7355"
+                    snap["status_label"] = f"Waiting on API... ({self.api_fail_count})"
+
+        if snap:
+            self.root.after(0, self._apply_refresh, snap)
+
+        if self.mode == "oc":
+            self.refresh_oc_mode()
+
+    def _apply_refresh(self, snap):
+        """Apply one refresh tick's UI changes on the Tk thread"""
+        if snap.get("reset_install_log"):
+            self._install_log_keys.clear()
+            self._install_lines = 0
+            self._pending_install_log = None
+            self._write_text(self.install_text, [])
+        if "status_text" in snap:
+            self.cluster_status.config(text=snap["status_text"], foreground=snap["status_fg"])
+        if "info" in snap:
+            self.cluster_info.config(text=snap["info"])
+        if "pct" in snap:
+            self.progress_bar.config(value=snap["pct"])
+            self.progress_label.config(text=f"{snap['pct']}%")
+        if "hosts" in snap:
+            self.update_hosts(snap["hosts"])
+        if "oc" in snap:
+            nodes, operators, node_conditions, op_conditions = snap["oc"]
+            self.update_nodes_table(nodes, operators, node_conditions, op_conditions)
+            self.update_operator_summary(operators, nodes, node_conditions, op_conditions)
+        if "tab" in snap:
+            self.notebook.select(snap["tab"])
+        if "oc" in snap:
+            self._render_install_log(self.update_operators_log, operators, op_conditions)
+        if "events" in snap:
+            self._render_install_log(self.update_install_log, snap["events"])
+        if "status_label" in snap:
+            self.status_label.config(text=snap["status_label"])
+        self.root.update_idletasks()
+
+    def _render_install_log(self, method, *args):
+        """Render into install_text now if its tab is showing, else keep only the latest update"""
+        if self.notebook.index("current") == INSTALL_TAB:
+            self._pending_install_log = None
+            method(*args)
+        else:
+            self._pending_install_log = (method, args)
+
+    def _on_tab_changed(self, event):
+        if self._pending_install_log and self.notebook.index("current") == INSTALL_TAB:
+            method, args = self._pending_install_log
+            self._pending_install_log = None
+            method(*args)
+
+    def _window_hidden(self):
+        return self.root.state() in ("iconic", "withdrawn")
+
+    def _next_refresh_interval(self):
+        """Pick the next refresh delay from the last cluster status, with +/-10% jitter"""
+        interval = REFRESH_INTERVALS.get(self.last_status, REFRESH_INTERVAL)
+        if self.mode == "oc":
+            # Each oc tick forks processes - never poll faster than the default
+            interval = max(interval, REFRESH_INTERVAL)
+        if self._window_hidden():
+            # Slow down while minimized, but never below the status cadence
+            return max(interval, HIDDEN_REFRESH_INTERVAL)
+        return int(interval * random.uniform(0.9, 1.1))
 
     def refresh_oc_mode(self):
         """Refresh using oc commands instead of API"""
-        nodes = self.get_oc_nodes()
-        operators = self.get_oc_operators()
+        nodes, operators = self.get_oc_nodes_and_operators()
 
         if not nodes:
-            self.root.after(0, lambda: self.cluster_status.config(
-                text="CONNECTING...",
-                foreground="#8b7355"
-            ))
+            self.root.after(0, self._apply_refresh, {
+                "status_text": "CONNECTING...",
+                "status_fg": "#8b7355",
+            })
             return
 
+        # Same oc output as last tick: nothing to redraw
+        if nodes is self._last_nodes and operators is self._last_operators:
+            self.root.after(0, self._apply_refresh, {
+                "status_label": f"Last update: {time.strftime('%H:%M:%S')} (oc)",
+            })
+            return
+        self._last_nodes = nodes
+        self._last_operators = operators
+
+        # Scan conditions once; the index is shared with the table and log updates
+        node_conditions = index_conditions(nodes)
+        op_conditions = index_conditions(operators)
+
         # Count ready nodes
-        ready_nodes = sum(1 for n in nodes if any(
-            c.get("type") == "Ready" and c.get("status") == "True"
-            for c in n.get("status", {}).get("conditions", [])
-        ))
+        ready_nodes = sum(1 for e in node_conditions.values() if e["Ready"])
         total_nodes = len(nodes)
 
         # Count available operators
-        available_ops = sum(1 for o in operators if any(
-            c.get("type") == "Available" and c.get("status") == "True"
-            for c in o.get("status", {}).get("conditions", [])
-        ))
+        available_ops = sum(1 for e in op_conditions.values() if e["Available"])
         total_ops = len(operators)
 
         # Calculate progress (nodes=30%, operators=70%)
@@ -491,84 +1002,133 @@ class AgentMonitor:
         else:
             status_text = f"FINALIZING ({total_pct}%)"
             status = "installing"
-
-        self.root.after(0, lambda t=status_text, s=status: self.cluster_status.config(
-            text=t,
-            foreground=self.status_color(s)
-        ))
-        self.root.after(0, lambda: self.cluster_info.config(
-            text=f"Nodes: {ready_nodes}/{total_nodes} Ready | Operators: {available_ops}/{total_ops} Available"
-        ))
-        self.root.after(0, lambda p=total_pct: self.progress_bar.config(value=p))
-        self.root.after(0, lambda p=total_pct: self.progress_label.config(text=f"{total_pct}%"))
-
-        # Update hosts table with nodes and operator rollout info
-        self.root.after(0, lambda n=nodes, o=operators: self.update_nodes_table(n, o))
-
-        # Update summary with nodes and problem operators
-        self.root.after(0, lambda n=nodes, o=operators: self.update_operator_summary(o, n))
-
-        # Update install log with operators
-        self.root.after(0, lambda o=operators: self.update_operators_log(o))
-
-        self.root.after(0, lambda: self.status_label.config(
-            text=f"Last update: {time.strftime('%H:%M:%S')} (oc)"
-        ))
+        self.last_status = status
+
+        # Nodes table, summary and operator log are all redrawn from "oc"
+        self.root.after(0, self._apply_refresh, {
+            "status_text": status_text,
+            "status_fg": STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR),
+            "info": f"Nodes: {ready_nodes}/{total_nodes} Ready | Operators: {available_ops}/{total_ops} Available",
+            "pct": total_pct,
+            "oc": (nodes, operators, node_conditions, op_conditions),
+            "status_label": f"Last update: {time.strftime('%H:%M:%S')} (oc)",
+        })
 
     def _load_agent_config(self):
         """Load hostname mappings from agent-config.yaml"""
         try:
             if os.path.exists(AGENT_CONFIG_FILE):
-                with open(AGENT_CONFIG_FILE, 'r') as f:
-                    config = yaml.safe_load(f)
-                    for host in config.get("hosts", []):
-                        hostname = host.get("hostname", "")
-                        role = host.get("role", "worker")
-                        # Map by MAC address
-                        for iface in host.get("interfaces", []):
-                            mac = iface.get("macAddress", "").lower()
-                            if mac and hostname:
-                                self.hostname_by_mac[mac] = hostname
-                        # Map by role (ordered list)
-                        if hostname:
-                            if role == "master":
-                                self.hostname_by_role["master"].append(hostname)
-                            else:
-                                self.hostname_by_role["worker"].append(hostname)
+                config = load_agent_config()
+                hostname_by_mac = {}
+                hostname_by_role = {"master": [], "worker": []}
+                for host in config.get("hosts", []):
+                    hostname = host.get("hostname", "")
+                    role = host.get("role", "worker")
+                    # Map by MAC address
+                    for iface in host.get("interfaces", []):
+                        mac = iface.get("macAddress", "").lower()
+                        if mac and hostname:
+                            hostname_by_mac[mac] = hostname
+                    # Map by role (ordered list)
+                    if hostname:
+                        if role == "master":
+                            hostname_by_role["master"].append(hostname)
+                        else:
+                            hostname_by_role["worker"].append(hostname)
+                # Swap in complete mappings; the mtime keys get_hostname's memo
+                self.hostname_by_mac = hostname_by_mac
+                self.hostname_by_role = hostname_by_role
+                self._agent_config_mtime = _agent_config_cache["mtime"]
                 log(f"Loaded {len(self.hostname_by_mac)} hostname mappings from agent-config.yaml")
                 log(f"Masters: {self.hostname_by_role['master']}")
                 log(f"Workers: {self.hostname_by_role['worker']}")
         except Exception as e:
             log(f"Failed to load agent-config.yaml: {e}")
 
-    def get_hostname(self, host):
-        """Get hostname from host data, falling back to agent-config.yaml mappings"""
+    def _parse_cached(self, cache, host, field):
+        """Parse a JSON string field of a host, reusing the last parse if unchanged
+
+        The result is also memoized on the host dict itself, so a payload the
+        API layer handed back unchanged is not even re-hashed.
+        """
+        memo = "_parsed_" + field
+        parsed = host.get(memo)
+        if parsed is not None:
+            return parsed
+        raw = host.get(field) or "{}"
+        if raw == "{}":
+            # Nothing reported yet (common for fresh hosts): no hash, no parse
+            host[memo] = parsed = {}
+            return parsed
+        digest = hash(raw)
+        host_id = host.get("id")
+        with self._parse_lock:
+            cached = cache.get(host_id)
+            if cached and cached[0] == digest:
+                cache.move_to_end(host_id)
+        if cached and cached[0] == digest:
+            parsed = cached[1]
+        else:
+            # Parse outside the lock; only the cache update is serialized
+            parsed = json_loads(raw)
+            with self._parse_lock:
+                cache[host_id] = (digest, parsed)
+                cache.move_to_end(host_id)
+                if len(cache) > PARSE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        host[memo] = parsed
+        return parsed
+
+    def _parsed_inventory(self, host):
+        return self._parse_cached(self._inv_cache, host, "inventory")
+
+    def _inventory_disk(self, inventory, name):
+        """Look up an inventory disk by name via an index built once per parse"""
+        disks_by_name = inventory.get("_disks_by_name")
+        if disks_by_name is None:
+            disks_by_name = {d.get("name"): d for d in inventory.get("disks", [])}
+            inventory["_disks_by_name"] = disks_by_name
+        return disks_by_name.get(name)
+
+    def _parsed_validations(self, host):
+        return self._parse_cached(self._validations_cache, host, "validations_info")
+
+    def get_hostname(self, host, inventory=None):
+        """Get hostname from host data, falling back to agent-config.yaml mappings
+
+        Callers that already parsed the host inventory can pass it in. The
+        result is memoized on the host dict, which the API layer reuses while
+        the payload is unchanged, tagged with the agent-config.yaml mtime it
+        was resolved against.
+        """
+        cached = host.get("_hostname")
+        if cached and cached[0] == self._agent_config_mtime:
+            return cached[1]
         hostname = host.get("requested_hostname") or ""
         source = "requested_hostname" if hostname else ""
 
         # Try inventory
         if not hostname:
             try:
-                inventory = json.loads(host.get("inventory", "{}"))
+                if inventory is None:
+                    inventory = self._parsed_inventory(host)
                 hostname = inventory.get("hostname") or ""
                 if hostname:
                     source = "inventory.hostname"
                 # Try MAC address lookup from inventory interfaces
                 if not hostname:
                     ifaces = inventory.get("interfaces", [])
-                    for iface in ifaces:
-                        mac = iface.get("mac_address", "").lower()
-                        if mac in self.hostname_by_mac:
-                            hostname = self.hostname_by_mac[mac]
-                            source = "agent-config (MAC)"
-                            break
-                        # Fallback to IP
-                        if not hostname:
-                            addrs = iface.get("ipv4_addresses", [])
-                            if addrs:
-                                hostname = addrs[0].split("/")[0]
-                                source = "ipv4_address"
-                                break
+                    hostname = next((self.hostname_by_mac[mac] for mac in
+                                     (i.get("mac_address", "").lower() for i in ifaces)
+                                     if mac in self.hostname_by_mac), "")
+                    if hostname:
+                        source = "agent-config (MAC)"
+                # Fallback to the first IPv4 address
+                if not hostname:
+                    hostname = next((a.split("/", 1)[0] for i in ifaces
+                                     for a in i.get("ipv4_addresses", ()) if a), "")
+                    if hostname:
+                        source = "ipv4_address"
             except Exception as e:
                 log(f"get_hostname inventory parse error: {e}")
 
@@ -590,44 +1150,72 @@ class AgentMonitor:
 
         result = hostname or "unknown"
         log(f"get_hostname: {result} (from {source or 'none'})")
+        host["_hostname"] = (self._agent_config_mtime, result)
         return result
 
-    def status_color(self, status):
-        colors = {
-            "ready": "#2d7d2d",
-            "installed": "#2d7d2d",
-            "done": "#2d7d2d",
-            "installing": "#4a6fa5",
-            "installing-in-progress": "#4a6fa5",
-            "preparing-for-installation": "#4a6fa5",
-            "preparing-successful": "#4a6fa5",
-            "pending-for-input": "#8b7355",
-            "insufficient": "#8b7355",
-            "rebooting": "#6b5b7a",
-            "error": "#a05050",
-            "known": "#2d7d2d",
-        }
-        return colors.get(status, "#555555")
+    def _configure_tag(self, tag):
+        """Configure a status tag missing from STATUS_COLORS (pre-registered in setup_ui)"""
+        if tag not in self._configured_tags:
+            self.hosts_tree.tag_configure(tag, foreground=STATUS_COLORS.get(tag, DEFAULT_STATUS_COLOR))
+            self._configured_tags.add(tag)
+
+    def _sync_tree(self, rows):
+        """Apply ordered (iid, values, tag) rows to hosts_tree, touching only changed rows"""
+        new_ids = [iid for iid, _, _ in rows]
+        for iid in set(self._tree_rows) - set(new_ids):
+            self.hosts_tree.delete(iid)
+            del self._tree_rows[iid]
+
+        # Track the tree's order locally (survivors keep their place, inserts
+        # append) so checking it needs no get_children round trip
+        order = [iid for iid in self._tree_order if iid in self._tree_rows]
+        for iid, values, tag in rows:
+            row = (values, tag)
+            old = self._tree_rows.get(iid)
+            if old == row:
+                continue
+            if old is None:
+                self._configure_tag(tag)
+                self.hosts_tree.insert("", tk.END, iid=iid, values=values, tags=(tag,))
+                order.append(iid)
+            elif old[1] == tag:
+                # Progress/disk ticks: leave the row's tag alone
+                self.hosts_tree.item(iid, values=values)
+            else:
+                self._configure_tag(tag)
+                self.hosts_tree.item(iid, values=values, tags=(tag,))
+            self._tree_rows[iid] = row
+
+        # Re-order only if the sort order actually changed: detach everything in
+        # one call, then re-attach in order so rows aren't shuffled one by one
+        if order != new_ids:
+            self.hosts_tree.detach(*order)
+            for index, iid in enumerate(new_ids):
+                self.hosts_tree.move(iid, "", index)
+        self._tree_order = new_ids
 
     def update_hosts(self, hosts):
-        # Clear existing items
-        for item in self.hosts_tree.get_children():
-            self.hosts_tree.delete(item)
-
         # Store hosts data for detail view
         self.hosts_data = {}
 
-        # Sort by role (master first), then by hostname
-        def sort_key(h):
-            role = h.get("role", "worker")
-            hostname = h.get("requested_hostname") or ""
-            role_order = 0 if role == "master" else 1
-            return (role_order, hostname)
+        # Sort by role (master first), then by hostname; keys computed once per host
+        keyed = [((0 if h.get("role") == "master" else 1, h.get("requested_hostname") or ""), h)
+                 for h in hosts]
+        keyed.sort(key=itemgetter(0))
 
         first_failing_host_id = None
-        for host in sorted(hosts, key=sort_key):
+        rows = []
+        for _, host in keyed:
             host_id = host.get("id")
-            hostname = self.get_hostname(host)
+
+            # Parse inventory once; hostname and disk info both read from it
+            try:
+                inventory = self._parsed_inventory(host)
+            except Exception as e:
+                log(f"update_hosts inventory parse error: {e}")
+                inventory = {}
+
+            hostname = self.get_hostname(host, inventory)
             role = host.get("role", "auto-assign")
             status = host.get("status", "unknown")
             status_info = host.get("status_info", "")
@@ -635,7 +1223,7 @@ class AgentMonitor:
             # Track first host with failing validation
             if not first_failing_host_id:
                 try:
-                    validations = json.loads(host.get("validations_info", "{}"))
+                    validations = self._parsed_validations(host)
                     for category, checks in validations.items():
                         for check in checks:
                             if check.get("status") in ("failure", "error"):
@@ -643,20 +1231,18 @@ class AgentMonitor:
                                 break
                         if first_failing_host_id:
                             break
-                except:
+                except (ValueError, TypeError, AttributeError):
                     pass
 
             # Get disk info from inventory
             disk_info = "N/A"
             try:
-                inventory = json.loads(host.get("inventory", "{}"))
-                disks = inventory.get("disks", [])
-                for d in disks:
-                    if d.get("name") == "sda":
-                        size_gb = d.get("size_bytes", 0) // (1024**3)
-                        eligible = d.get("installation_eligibility", {}).get("eligible")
-                        disk_info = f"{size_gb}GB {'✓' if eligible else '✗'}"
-            except:
+                d = self._inventory_disk(inventory, "sda")
+                if d:
+                    size_gb = d.get("size_bytes", 0) >> GIB_SHIFT
+                    eligible = (d.get("installation_eligibility") or {}).get("eligible")
+                    disk_info = f"{size_gb}GB {'✓' if eligible else '✗'}"
+            except (ValueError, TypeError, AttributeError):
                 pass
 
             # Show progress percentage and stage
@@ -670,35 +1256,72 @@ class AgentMonitor:
             else:
                 progress_text = status_info[:40] + "..." if len(status_info) > 40 else status_info
 
-            self.hosts_tree.insert("", tk.END, iid=host_id, values=(
-                hostname, role, status, disk_info, progress_text
-            ))
-
             # Color by status
-            self.hosts_tree.tag_configure(status, foreground=self.status_color(status))
-            self.hosts_tree.item(host_id, tags=(status,))
+            rows.append((host_id, (hostname, role, status, disk_info, progress_text), status))
 
             # Store for details
             self.hosts_data[host_id] = host
 
-        # Auto-select first host if none selected, or re-select previously selected
-        children = self.hosts_tree.get_children()
+        self._sync_tree(rows)
+
+        # Auto-select first host if none selected. Rows are updated in place,
+        # so an existing selection survives; selection_set fires
+        # <<TreeviewSelect>>, which redraws the details, so only call it when
+        # the selection was lost and otherwise redraw only for a changed host
+        children = self._tree_order
         if children:
-            if self.selected_host_id and self.selected_host_id in children:
-                self.hosts_tree.selection_set(self.selected_host_id)
-                self.show_host_details(self.selected_host_id)
-            elif not self.selected_host_id:
-                # Select first host by default
+            if not self.selected_host_id:
                 self.selected_host_id = children[0]
-                self.hosts_tree.selection_set(self.selected_host_id)
-                self.show_host_details(self.selected_host_id)
+            if self.selected_host_id in children:
+                if self.hosts_tree.selection() != (self.selected_host_id,):
+                    self.hosts_tree.selection_set(self.selected_host_id)
+                elif self.hosts_data[self.selected_host_id] is not self._details_host:
+                    self.show_host_details(self.selected_host_id)
 
         # Update summary tab with all failing validations
         self.update_summary(hosts)
 
+    def _write_text(self, widget, chunks, replace=True):
+        """Write (text, tag) chunks to a Text widget in a single multi-segment insert
+
+        Returns False when a replace was skipped because the content is unchanged.
+        """
+        # Merge runs that share a tag so the insert carries as few segments as possible
+        merged = []
+        for text, tag in chunks:
+            if merged and merged[-1][1] == tag:
+                merged[-1][0].append(text)
+            else:
+                merged.append(([text], tag))
+        parts = []
+        for texts, tag in merged:
+            parts.append("".join(texts))
+            parts.append((tag,) if tag else ())
+
+        # Re-rendering identical content is common in steady state; skip the
+        # Tk round trips (and keep the scroll position) when nothing changed
+        if replace:
+            if self._text_written.get(widget) == parts:
+                return False
+            self._text_written[widget] = parts
+        else:
+            self._text_written.pop(widget, None)
+        if not parts:
+            parts = ["", ()]
+
+        # Text panes are read-only (READONLY_TEXT_OPTS) and unlocked just for
+        # the write; Text.insert takes alternating text/tags arguments and
+        # applies them in one Tcl call
+        widget.config(state=tk.NORMAL)
+        if replace:
+            widget.delete("1.0", tk.END)
+        widget.insert(tk.END, *parts)
+        widget.config(state=tk.DISABLED)
+        return True
+
     def update_summary(self, hosts):
         """Update summary tab with all failing validations across all hosts"""
-        self.summary_text.delete("1.0", tk.END)
+        chunks = []
 
         has_failures = False
         for host in hosts:
@@ -707,7 +1330,7 @@ class AgentMonitor:
             # Collect failures for this host
             host_failures = []
             try:
-                validations = json.loads(host.get("validations_info", "{}"))
+                validations = self._parsed_validations(host)
                 for category, checks in validations.items():
                     for check in checks:
                         status = check.get("status", "")
@@ -715,61 +1338,53 @@ class AgentMonitor:
                             check_id = check.get("id", "")
                             msg = check.get("message", "")
                             host_failures.append((status, check_id, msg))
-            except:
+            except (ValueError, TypeError, AttributeError):
                 pass
 
             # Display failures for this host
             if host_failures:
                 has_failures = True
-                self.summary_text.insert(tk.END, f"\n{hostname}\n", "host")
+                chunks.append((f"\n{hostname}\n", "host"))
                 for status, check_id, msg in host_failures:
-                    tag = "failure" if status == "failure" else "error"
-                    symbol = "✗" if status == "failure" else "!"
-                    self.summary_text.insert(tk.END, f"  {symbol} {check_id}: {msg}\n", tag)
+                    chunks.append((f"  {VALIDATION_SYMBOLS[status]} {check_id}: {msg}\n", status))
 
         if not has_failures:
-            self.summary_text.insert(tk.END, "All validations passing\n", "success")
+            chunks.append(("All validations passing\n", "success"))
 
-    def update_operator_summary(self, operators, nodes=None):
+        self._write_text(self.summary_text, chunks)
+
+    def update_operator_summary(self, operators, nodes=None, node_conditions=None, op_conditions=None):
         """Update summary tab with nodes and problem operators"""
-        self.summary_text.delete("1.0", tk.END)
+        if node_conditions is None:
+            node_conditions = index_conditions(nodes or [])
+        if op_conditions is None:
+            op_conditions = index_conditions(operators)
+        chunks = []
 
         # Show node status first
         if nodes:
-            self.summary_text.insert(tk.END, "Nodes\n", "host")
+            chunks.append(("Nodes\n", "host"))
             for node in sorted(nodes, key=lambda n: n.get("metadata", {}).get("name", "")):
                 name = node.get("metadata", {}).get("name", "unknown")
-                labels = node.get("metadata", {}).get("labels", {})
-                conditions = node.get("status", {}).get("conditions", [])
-                ready = any(c.get("type") == "Ready" and c.get("status") == "True" for c in conditions)
+                ready = node_conditions.get(name, {}).get("Ready", False)
 
-                role = "master" if "node-role.kubernetes.io/master" in labels or "node-role.kubernetes.io/control-plane" in labels else "worker"
+                role = "master" if is_master(node) else "worker"
 
                 if ready:
-                    self.summary_text.insert(tk.END, f"  ✓ {name} ({role}) Ready\n", "success")
+                    chunks.append((f"  ✓ {name} ({role}) Ready\n", "success"))
                 else:
-                    self.summary_text.insert(tk.END, f"  ○ {name} ({role}) NotReady\n", "error")
-            self.summary_text.insert(tk.END, "\n")
+                    chunks.append((f"  ○ {name} ({role}) NotReady\n", "error"))
+            chunks.append(("\n", None))
 
         # Show problem operators
         problem_ops = []
         for op in operators:
             name = op.get("metadata", {}).get("name", "unknown")
-            conditions = op.get("status", {}).get("conditions", [])
-
-            available = any(c.get("type") == "Available" and c.get("status") == "True" for c in conditions)
-            progressing = any(c.get("type") == "Progressing" and c.get("status") == "True" for c in conditions)
-            degraded = any(c.get("type") == "Degraded" and c.get("status") == "True" for c in conditions)
-
-            # Get message
-            msg = ""
-            for c in conditions:
-                if c.get("type") == "Progressing" and c.get("message"):
-                    msg = c.get("message", "")
-                    break
-                if c.get("type") == "Degraded" and c.get("status") == "True" and c.get("message"):
-                    msg = c.get("message", "")
-                    break
+            entry = op_conditions[op.get("metadata", {}).get("name", "")]
+            available = entry["Available"]
+            progressing = entry["Progressing"]
+            degraded = entry["Degraded"]
+            msg = entry["problem_message"]
 
             if degraded:
                 problem_ops.append((name, "degraded", msg))
@@ -779,104 +1394,94 @@ class AgentMonitor:
                 problem_ops.append((name, "progressing", msg))
 
         if problem_ops:
-            self.summary_text.insert(tk.END, f"Problem Operators ({len(problem_ops)})\n", "host")
+            chunks.append((f"Problem Operators ({len(problem_ops)})\n", "host"))
             for name, status, msg in problem_ops:
                 if status == "degraded":
-                    self.summary_text.insert(tk.END, f"  ✗ {name} (degraded)\n", "failure")
+                    chunks.append((f"  ✗ {name} (degraded)\n", "failure"))
                 elif status == "unavailable":
-                    self.summary_text.insert(tk.END, f"  ○ {name} (unavailable)\n", "error")
+                    chunks.append((f"  ○ {name} (unavailable)\n", "error"))
                 else:
-                    self.summary_text.insert(tk.END, f"  ● {name} (progressing)\n", "pending")
+                    chunks.append((f"  ● {name} (progressing)\n", "pending"))
                 if msg:
-                    self.summary_text.insert(tk.END, f"      {msg[:100]}\n", "pending")
+                    chunks.append((f"      {msg[:100]}\n", "pending"))
         else:
-            self.summary_text.insert(tk.END, "All operators available\n", "success")
+            chunks.append(("All operators available\n", "success"))
+
+        self._write_text(self.summary_text, chunks)
 
     def update_install_log(self, events):
-        """Update installation event log"""
-        self.install_text.delete("1.0", tk.END)
+        """Append new installation events, keeping the last INSTALL_LOG_LINES"""
+        new_events = []
+        for event in events[-INSTALL_LOG_LINES:]:
+            key = event.get("event_id") or (event.get("event_time"), event.get("message"))
+            if key not in self._install_log_keys:
+                new_events.append((key, event))
+        if not new_events:
+            return
 
-        # Show recent events (last 50)
-        for event in events[-50:]:
+        chunks = []
+        for key, event in new_events:
+            self._install_log_keys.append(key)
             msg = event.get("message", "")
             severity = event.get("severity", "info")
 
             # Color based on content
-            if "Done" in msg or "installed" in msg:
+            if DONE_EVENT_RE.search(msg):
                 tag = "done"
-            elif "error" in msg.lower() or severity == "error":
+            elif severity == "error" or ERROR_EVENT_RE.search(msg):
                 tag = "error"
             else:
                 tag = "info"
 
-            self.install_text.insert(tk.END, f"INFO {msg}\n", tag)
+            chunks.append((f"INFO {msg}\n", tag))
+
+        self._write_text(self.install_text, chunks, replace=False)
+
+        # Drop the oldest lines beyond the cap in one call; the line count is
+        # tracked here (messages may span lines) rather than asked of Tk
+        self._install_lines += sum(text.count("\n") for text, _ in chunks)
+        excess = self._install_lines - INSTALL_LOG_LINES
+        if excess > 0:
+            self.install_text.config(state=tk.NORMAL)
+            self.install_text.delete("1.0", f"{excess + 1}.0")
+            self.install_text.config(state=tk.DISABLED)
+            self._install_lines = INSTALL_LOG_LINES
 
         # Auto-scroll to bottom
         self.install_text.see(tk.END)
 
-    def update_nodes_table(self, nodes, operators=None):
+    def update_nodes_table(self, nodes, operators=None, node_conditions=None, op_conditions=None):
         """Update hosts table with node info from oc"""
-        for item in self.hosts_tree.get_children():
-            self.hosts_tree.delete(item)
-
         self.hosts_data = {}
+        if node_conditions is None:
+            node_conditions = index_conditions(nodes)
+        if op_conditions is None:
+            op_conditions = index_conditions(operators or [])
 
-        # Build map of which operators are rolling out to which nodes
+        # Build map of which operators are rolling out to which nodes.
+        # Control plane operators roll out to master nodes; list those once.
         node_rollouts = {}
-        control_plane_ops = {"etcd", "kube-apiserver", "kube-controller-manager",
-                            "kube-scheduler", "openshift-apiserver", "authentication",
-                            "openshift-controller-manager"}
-
         if operators:
+            master_names = [n.get("metadata", {}).get("name", "") for n in nodes if is_master(n)]
             for op in operators:
                 op_name = op.get("metadata", {}).get("name", "")
-                conditions = op.get("status", {}).get("conditions", [])
-                is_progressing = any(
-                    c.get("type") == "Progressing" and c.get("status") == "True"
-                    for c in conditions
-                )
-                is_available = any(
-                    c.get("type") == "Available" and c.get("status") == "True"
-                    for c in conditions
-                )
-
+                if op_name not in CONTROL_PLANE_OPERATORS:
+                    continue
                 # Only show if progressing AND not yet available
-                if is_progressing and not is_available:
-                    # Control plane operators roll out to master nodes
-                    if op_name in control_plane_ops:
-                        for node in nodes:
-                            node_name = node.get("metadata", {}).get("name", "")
-                            labels = node.get("metadata", {}).get("labels", {})
-                            is_master = "node-role.kubernetes.io/master" in labels or \
-                                       "node-role.kubernetes.io/control-plane" in labels
-                            if is_master:
-                                if node_name not in node_rollouts:
-                                    node_rollouts[node_name] = []
-                                if op_name not in node_rollouts[node_name]:
-                                    node_rollouts[node_name].append(op_name)
+                entry = op_conditions[op_name]
+                if entry["Progressing"] and not entry["Available"]:
+                    # Operator names are unique, so no per-node dedup is needed
+                    for node_name in master_names:
+                        node_rollouts.setdefault(node_name, []).append(op_name)
 
         # Sort nodes: masters first, then workers
-        def sort_key(n):
-            name = n.get("metadata", {}).get("name", "")
-            labels = n.get("metadata", {}).get("labels", {})
-            is_master = "node-role.kubernetes.io/master" in labels or "node-role.kubernetes.io/control-plane" in labels
-            return (0 if is_master else 1, name)
-
-        for node in sorted(nodes, key=sort_key):
+        rows = []
+        for node in sorted(nodes, key=node_sort_key):
             name = node.get("metadata", {}).get("name", "unknown")
-            labels = node.get("metadata", {}).get("labels", {})
-
-            # Determine role
-            if "node-role.kubernetes.io/master" in labels or "node-role.kubernetes.io/control-plane" in labels:
-                role = "master"
-            elif "node-role.kubernetes.io/worker" in labels:
-                role = "worker"
-            else:
-                role = "unknown"
+            role = node_role(node)
 
             # Get status
-            conditions = node.get("status", {}).get("conditions", [])
-            ready = any(c.get("type") == "Ready" and c.get("status") == "True" for c in conditions)
+            ready = node_conditions.get(node.get("metadata", {}).get("name", ""), {}).get("Ready", False)
             status = "Ready" if ready else "NotReady"
 
             # Get version
@@ -891,59 +1496,57 @@ class AgentMonitor:
             else:
                 progress = "Complete"
 
-            self.hosts_tree.insert("", tk.END, iid=name, values=(
-                name, role, status, version, progress
-            ))
-
             if rollouts:
                 tag = "installing-in-progress"
             elif ready:
                 tag = "ready"
             else:
                 tag = "error"
-            self.hosts_tree.tag_configure(tag, foreground=self.status_color(tag))
-            self.hosts_tree.item(name, tags=(tag,))
+            rows.append((name, (name, role, status, version, progress), tag))
 
-    def update_operators_log(self, operators):
+        # Host rows from API mode are removed here since their ids don't match
+        self._sync_tree(rows)
+
+    def update_operators_log(self, operators, op_conditions=None):
         """Update install log with operator status"""
-        self.install_text.delete("1.0", tk.END)
+        self._install_log_keys.clear()
+        if op_conditions is None:
+            op_conditions = index_conditions(operators)
 
         # Sort: unavailable first, then by name
         def sort_key(o):
             name = o.get("metadata", {}).get("name", "")
-            conditions = o.get("status", {}).get("conditions", [])
-            available = any(c.get("type") == "Available" and c.get("status") == "True" for c in conditions)
-            return (0 if not available else 1, name)
+            return (1 if op_conditions[name]["Available"] else 0, name)
 
+        chunks = []
         for op in sorted(operators, key=sort_key):
             name = op.get("metadata", {}).get("name", "unknown")
-            conditions = op.get("status", {}).get("conditions", [])
+            entry = op_conditions[op.get("metadata", {}).get("name", "")]
 
-            available = any(c.get("type") == "Available" and c.get("status") == "True" for c in conditions)
-            progressing = any(c.get("type") == "Progressing" and c.get("status") == "True" for c in conditions)
-            degraded = any(c.get("type") == "Degraded" and c.get("status") == "True" for c in conditions)
+            available = entry["Available"]
+            progressing = entry["Progressing"]
+            degraded = entry["Degraded"]
 
             # Get message if progressing
-            msg = ""
-            for c in conditions:
-                if c.get("type") == "Progressing" and c.get("message"):
-                    msg = c.get("message", "")[:60]
-                    break
+            msg = entry["message"][:60]
 
             if available and not progressing:
-                self.install_text.insert(tk.END, f"✓ {name}\n", "done")
+                chunks.append((f"✓ {name}\n", "done"))
             elif degraded:
-                self.install_text.insert(tk.END, f"✗ {name}\n", "error")
+                chunks.append((f"✗ {name}\n", "error"))
                 if msg:
-                    self.install_text.insert(tk.END, f"    {msg}\n", "info")
+                    chunks.append((f"    {msg}\n", "info"))
             elif progressing:
-                self.install_text.insert(tk.END, f"● {name}\n", "stage")
+                chunks.append((f"● {name}\n", "stage"))
                 if msg:
-                    self.install_text.insert(tk.END, f"    {msg}\n", "info")
+                    chunks.append((f"    {msg}\n", "info"))
             else:
-                self.install_text.insert(tk.END, f"○ {name}\n", "info")
+                chunks.append((f"○ {name}\n", "info"))
 
-        self.install_text.see(tk.END)
+        # Unchanged log: leave the user's scroll position alone
+        if self._write_text(self.install_text, chunks):
+            self._install_lines = sum(text.count("\n") for text, _ in chunks)
+            self.install_text.see(tk.END)
 
     def on_host_select(self, event):
         selection = self.hosts_tree.selection()
@@ -958,61 +1561,64 @@ class AgentMonitor:
         host = self.hosts_data.get(host_id)
         if not host:
             return
+        self._details_host = host
+
+        # Build the whole pane as (text, tag) chunks and write it in one go
+        chunks = []
 
-        self.details_text.delete("1.0", tk.END)
+        def add(text, tag=None):
+            chunks.append((text, tag))
 
         hostname = self.get_hostname(host)
         status = host.get("status", "unknown")
-        self.details_text.insert(tk.END, f"=== {hostname} ({status}) ===\n\n")
+        add(f"=== {hostname} ({status}) ===\n\n")
 
         # Parse validations
         try:
-            validations = json.loads(host.get("validations_info", "{}"))
+            validations = self._parsed_validations(host)
 
             for category, checks in validations.items():
-                self.details_text.insert(tk.END, f"\n[{category.upper()}]\n")
+                add(f"\n[{category.upper()}]\n")
 
                 for check in checks:
                     status = check.get("status", "unknown")
                     msg = check.get("message", "")
                     check_id = check.get("id", "")
 
-                    symbol = {"success": "✓", "failure": "✗", "error": "!", "pending": "○"}.get(status, "?")
-                    line = f"  {symbol} {check_id}: {msg}\n"
-
-                    self.details_text.insert(tk.END, line, status)
+                    add(f"  {VALIDATION_SYMBOLS.get(status, '?')} {check_id}: {msg}\n", status)
         except Exception as e:
-            self.details_text.insert(tk.END, f"Error parsing validations: {e}")
+            add(f"Error parsing validations: {e}")
 
         # Show disk details
         try:
-            inventory = json.loads(host.get("inventory", "{}"))
+            inventory = self._parsed_inventory(host)
             disks = inventory.get("disks", [])
 
-            self.details_text.insert(tk.END, f"\n\n[DISKS]\n")
+            add(f"\n\n[DISKS]\n")
             for d in disks:
                 name = d.get("name")
-                size_gb = d.get("size_bytes", 0) // (1024**3)
-                eligible = d.get("installation_eligibility", {})
+                size_gb = d.get("size_bytes", 0) >> GIB_SHIFT
+                eligible = d.get("installation_eligibility") or {}
                 is_eligible = eligible.get("eligible")
                 reasons = eligible.get("not_eligible_reasons") or []
 
                 status_tag = "success" if is_eligible else "failure"
-                self.details_text.insert(tk.END, f"  {name}: {size_gb}GB - ", status_tag)
+                add(f"  {name}: {size_gb}GB - ", status_tag)
 
                 if is_eligible:
-                    self.details_text.insert(tk.END, "Eligible\n", "success")
+                    add("Eligible\n", "success")
                 else:
-                    self.details_text.insert(tk.END, f"Not eligible: {', '.join(reasons)}\n", "failure")
-        except:
+                    add(f"Not eligible: {', '.join(reasons)}\n", "failure")
+        except (ValueError, TypeError, AttributeError):
             pass
 
+        self._write_text(self.details_text, chunks)
+
     def _load_node_ips(self):
         """Derive node IPs from agent-config.yaml host order and rendezvous IP"""
         try:
             if os.path.exists(AGENT_CONFIG_FILE):
-                with open(AGENT_CONFIG_FILE, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = load_agent_config()
                 rendezvous = config.get("rendezvousIP", "192.168.1.201")
                 base_net, base_host = rendezvous.rsplit('.', 1)
                 base_host = int(base_host)
@@ -1037,29 +1643,40 @@ class AgentMonitor:
         if self.debug_checking:
             return
         self.debug_checking = True
-        self.root.after(0, lambda: self.debug_status_label.config(text="Checking..."))
+        self.debug_status_label.config(text="Checking...")
 
         def do_checks():
-            from concurrent.futures import ThreadPoolExecutor, as_completed
             results = {}
+            futures = {}
+            for hostname, ip in self.node_ips.items():
+                futures[self._debug_pool.submit(self._ssh_check_node, hostname, ip)] = hostname
+            # Cluster-level oc queries (oc mode) run alongside the SSH checks
+            if self.mode == "oc":
+                env = {**os.environ, "KUBECONFIG": os.path.join(SCRIPT_DIR, "gw", "auth", "kubeconfig")}
+                futures[self._debug_pool.submit(self._check_pending_csrs, env)] = "_csr"
+                futures[self._debug_pool.submit(self._check_mc_desync, env)] = "_nodes"
 
-            with ThreadPoolExecutor(max_workers=6) as executor:
-                futures = {}
-                for hostname, ip in self.node_ips.items():
-                    futures[executor.submit(self._ssh_check_node, hostname, ip)] = hostname
-
-                for future in as_completed(futures):
+            try:
+                for future in as_completed(futures, timeout=DEBUG_CHECK_TIMEOUT):
                     hostname = futures[future]
                     try:
                         results[hostname] = future.result()
                     except Exception as e:
                         results[hostname] = [("error", f"Check failed: {e}")]
+            except FuturesTimeout:
+                for future, hostname in futures.items():
+                    if hostname in results:
+                        continue
+                    # Drop checks that never got a worker rather than let them
+                    # run into the next round
+                    if future.cancel():
+                        results[hostname] = [("warning", "Check skipped (no free worker)")]
+                    else:
+                        results[hostname] = [("error", "Check timed out")]
 
-            # Also check cluster-level issues if in oc mode
-            if self.mode == "oc":
-                cluster_findings = self._check_cluster_issues()
-                if cluster_findings:
-                    results["_cluster"] = cluster_findings
+            cluster_findings = results.pop("_csr", []) + results.pop("_nodes", [])
+            if cluster_findings:
+                results["_cluster"] = cluster_findings
 
             self.debug_findings = results
             self.last_debug_check = time.strftime('%H:%M:%S')
@@ -1075,7 +1692,9 @@ class AgentMonitor:
         try:
             result = subprocess.run(
                 ["ssh"] + SSH_OPTS + [f"core@{ip}", SSH_CHECK_CMD],
-                capture_output=True, text=True, timeout=15
+                # stderr to /dev/null: a backgrounded ControlPersist master
+                # could otherwise hold the pipe open past the command
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=15
             )
         except subprocess.TimeoutExpired:
             return [("error", "SSH timeout (15s)")]
@@ -1085,41 +1704,40 @@ class AgentMonitor:
         if result.returncode != 0 and not result.stdout:
             return [("error", "SSH unreachable")]
 
-        output = result.stdout
+        # Read as bytes and decode once: journal lines can carry bytes that
+        # aren't valid UTF-8, which text=True would turn into a failed check
+        output = result.stdout.decode("utf-8", "replace")
 
-        # Parse sections
-        sections = {}
+        # Parse sections; only "===" lines are worth a regex match
+        sections = defaultdict(list)
         current = None
         for line in output.split('\n'):
-            if line.startswith("===") and line.endswith("==="):
-                current = line.strip("=")
-                sections[current] = []
-            elif current:
+            if line.startswith("==="):
+                header = SECTION_HEADER_RE.match(line)
+                if header:
+                    current = header.group(1)
+                    continue
+            if current:
                 sections[current].append(line)
 
         # Check kubelet
-        kubelet = '\n'.join(sections.get("KUBELET", [])).strip()
+        kubelet = '\n'.join(sections["KUBELET"]).strip()
         if kubelet != "active":
             findings.append(("error", f"kubelet: {kubelet}"))
 
         # Check crio
-        crio = '\n'.join(sections.get("CRIO", [])).strip()
+        crio = '\n'.join(sections["CRIO"]).strip()
         if crio != "active":
             findings.append(("error", f"crio: {crio}"))
 
         # Classify issues from journal
-        issues = [l.strip() for l in sections.get("ISSUES", []) if l.strip()]
-        cert_issues = []
-        pull_issues = []
-        other_issues = []
+        issues = [l for l in map(str.strip, sections["ISSUES"]) if l]
+        classified = {"cert": [], "pull": [], "other": []}
         for line in issues:
-            lower = line.lower()
-            if "x509" in lower or "certificate" in lower or "crypto" in lower:
-                cert_issues.append(line)
-            elif "errimagepull" in lower or "imagepullbackoff" in lower or "manifest unknown" in lower:
-                pull_issues.append(line)
-            else:
-                other_issues.append(line)
+            classified[classify_issue(line)].append(line)
+        cert_issues = classified["cert"]
+        pull_issues = classified["pull"]
+        other_issues = classified["other"]
 
         if cert_issues:
             findings.append(("error", f"TLS/cert errors ({len(cert_issues)})"))
@@ -1134,27 +1752,24 @@ class AgentMonitor:
                 findings.append(("warning", f"  {line[:120]}"))
 
         # Check MachineConfig
-        mc = '\n'.join(sections.get("MC", [])).strip()
+        mc = '\n'.join(sections["MC"]).strip()
         if mc == "not-found":
             findings.append(("warning", "MachineConfig: currentconfig not found"))
         elif mc:
             findings.append(("info", f"MC: {mc}"))
 
         # Check disk usage
-        for line in sections.get("DISK", []):
-            parts = line.split()
-            if len(parts) >= 5:
-                try:
-                    use_pct = int(parts[4].rstrip('%'))
-                    mount = parts[5] if len(parts) > 5 else ""
-                    if use_pct > 85:
-                        findings.append(("warning", f"Disk {mount}: {use_pct}% used"))
-                except (ValueError, IndexError):
-                    pass
+        for line in sections["DISK"]:
+            m = DF_USE_RE.search(line)
+            if m:
+                use_pct = int(m.group(1))
+                if use_pct > 85:
+                    findings.append(("warning", f"Disk {m.group(2) or ''}: {use_pct}% used"))
 
         # Check memory
-        for line in sections.get("MEM", []):
-            parts = line.split()
+        for line in sections["MEM"]:
+            # Only "Mem:", total and used are read
+            parts = line.split(None, 3)
             if len(parts) >= 3:
                 try:
                     total = int(parts[1])
@@ -1166,7 +1781,7 @@ class AgentMonitor:
                     pass
 
         # Check non-running containers
-        containers = [l.strip() for l in sections.get("CONTAINERS", []) if l.strip()]
+        containers = [l for l in map(str.strip, sections["CONTAINERS"]) if l]
         if containers:
             findings.append(("warning", f"Non-running containers: {len(containers)}"))
             for line in containers[-3:]:
@@ -1177,40 +1792,33 @@ class AgentMonitor:
 
         return findings
 
-    def _check_cluster_issues(self):
-        """Check for cluster-level issues via oc commands"""
+    def _check_pending_csrs(self, env):
+        """Check for pending CSRs (no conditions yet = neither approved nor denied)"""
         findings = []
-        kubeconfig = os.path.join(SCRIPT_DIR, "gw", "auth", "kubeconfig")
-        env = {**os.environ, "KUBECONFIG": kubeconfig}
-
-        # Check for pending CSRs
         try:
             result = subprocess.run(
-                ["oc", "get", "csr", "-o", "json"],
+                ["oc", "get", "csr", "-o", CSR_CONDITIONS_JSONPATH],
                 capture_output=True, text=True, timeout=10, env=env
             )
             if result.returncode == 0:
-                csrs = json.loads(result.stdout).get("items", [])
-                pending = [c for c in csrs if not c.get("status", {}).get("conditions")]
+                pending = sum(1 for l in result.stdout.splitlines() if l and not l.partition("\t")[2])
                 if pending:
-                    findings.append(("warning", f"Pending CSRs: {len(pending)}"))
+                    findings.append(("warning", f"Pending CSRs: {pending}"))
         except Exception:
             pass
+        return findings
 
-        # Check MachineConfig annotations (desync detection)
+    def _check_mc_desync(self, env):
+        """Check node MachineConfig annotations for current/desired desync"""
+        findings = []
         try:
             result = subprocess.run(
-                ["oc", "get", "nodes", "-o", "json"],
+                ["oc", "get", "nodes", "-o", NODE_MC_JSONPATH],
                 capture_output=True, text=True, timeout=10, env=env
             )
             if result.returncode == 0:
-                nodes = json.loads(result.stdout).get("items", [])
-                for node in nodes:
-                    name = node.get("metadata", {}).get("name", "")
-                    annotations = node.get("metadata", {}).get("annotations", {})
-                    current = annotations.get("machineconfiguration.openshift.io/currentConfig", "")
-                    desired = annotations.get("machineconfiguration.openshift.io/desiredConfig", "")
-                    state = annotations.get("machineconfiguration.openshift.io/state", "")
+                for line in result.stdout.splitlines():
+                    name, current, desired, state = (line.split("\t", 3) + ["", "", ""])[:4]
                     if current and desired and current != desired:
                         findings.append(("error",
                             f"MC desync on {name}: current={current[:30]} desired={desired[:30]} state={state}"))
@@ -1221,11 +1829,11 @@ class AgentMonitor:
 
     def _update_debug_display(self):
         """Update the debug tab text widget with current findings"""
-        self.debug_text.delete("1.0", tk.END)
+        chunks = []
         check_time = self.last_debug_check or "never"
         self.debug_status_label.config(text=f"Last: {check_time}")
 
-        self.debug_text.insert(tk.END, f"Debug Check at {check_time}\n\n", "header")
+        chunks.append((f"Debug Check at {check_time}\n\n", "header"))
 
         # Count total errors/warnings
         total_errors = 0
@@ -1235,14 +1843,14 @@ class AgentMonitor:
         if "_cluster" in self.debug_findings:
             cluster = self.debug_findings["_cluster"]
             if cluster:
-                self.debug_text.insert(tk.END, "Cluster\n", "header")
+                chunks.append(("Cluster\n", "header"))
                 for severity, msg in cluster:
-                    self.debug_text.insert(tk.END, f"  {msg}\n", severity)
+                    chunks.append((f"  {msg}\n", severity))
                     if severity == "error":
                         total_errors += 1
                     elif severity == "warning":
                         total_warnings += 1
-                self.debug_text.insert(tk.END, "\n")
+                chunks.append(("\n", None))
 
         # Show per-node findings (masters first, then workers)
         sorted_nodes = sorted(
@@ -1254,51 +1862,55 @@ class AgentMonitor:
             findings = self.debug_findings.get(hostname, [])
             short_name = hostname.split('.')[0]
 
-            # Determine node-level severity
-            has_errors = any(s == "error" for s, _ in findings)
-            has_warnings = any(s == "warning" for s, _ in findings)
-            is_ok = all(s in ("ok", "info") for s, _ in findings)
+            # Determine node-level severity from one pass over the findings
+            counts = Counter(s for s, _ in findings)
+            is_ok = counts.keys() <= {"ok", "info"}
 
-            if has_errors:
+            if counts["error"]:
                 node_tag = "error"
-                total_errors += sum(1 for s, _ in findings if s == "error")
-            elif has_warnings:
+                total_errors += counts["error"]
+            elif counts["warning"]:
                 node_tag = "warning"
-                total_warnings += sum(1 for s, _ in findings if s == "warning")
+                total_warnings += counts["warning"]
             elif is_ok:
                 node_tag = "ok"
             else:
                 node_tag = "info"
 
-            self.debug_text.insert(tk.END, f"{short_name} ", "header")
-            self.debug_text.insert(tk.END, f"({ip})\n", "info")
+            chunks.append((f"{short_name} ", "header"))
+            chunks.append((f"({ip})\n", "info"))
 
             for severity, msg in findings:
-                self.debug_text.insert(tk.END, f"  {msg}\n", severity)
+                chunks.append((f"  {msg}\n", severity))
 
-            self.debug_text.insert(tk.END, "\n")
+            chunks.append(("\n", None))
 
         # Summary line
         if total_errors == 0 and total_warnings == 0:
-            self.debug_text.insert(tk.END, "All nodes healthy\n", "ok")
+            chunks.append(("All nodes healthy\n", "ok"))
         else:
             summary = []
             if total_errors:
                 summary.append(f"{total_errors} errors")
             if total_warnings:
                 summary.append(f"{total_warnings} warnings")
-            self.debug_text.insert(tk.END, f"Found: {', '.join(summary)}\n", "error" if total_errors else "warning")
+            chunks.append((f"Found: {', '.join(summary)}\n", "error" if total_errors else "warning"))
+
+        self._write_text(self.debug_text, chunks)
 
     def run_gather_debug(self):
         """Run gatherdebug.sh in background"""
         if not os.path.exists(GATHERDEBUG_SCRIPT):
-            self.debug_text.insert(tk.END, f"\nERROR: {GATHERDEBUG_SCRIPT} not found\n", "error")
+            self._write_text(self.debug_text, [(f"\nERROR: {GATHERDEBUG_SCRIPT} not found\n", "error")], replace=False)
             return
 
         self.debug_status_label.config(text="Gathering debug...")
-        self.debug_text.insert(tk.END, f"\nRunning gatherdebug.sh...\n", "header")
+        self._write_text(self.debug_text, [("\nRunning gatherdebug.sh...\n", "header")], replace=False)
 
         def do_gather():
+            # Collect output and status, then hand both to the Tk thread at once
+            chunks = []
+            status = None
             try:
                 result = subprocess.run(
                     ["bash", GATHERDEBUG_SCRIPT],
@@ -1309,78 +1921,99 @@ class AgentMonitor:
                 # Find the tarball path in output
                 for line in output.split('\n'):
                     if "Tarball:" in line:
-                        self.root.after(0, lambda l=line: self.debug_text.insert(tk.END, f"{l.strip()}\n", "ok"))
+                        chunks.append((f"{line.strip()}\n", "ok"))
                     elif "Debug gathered:" in line:
-                        self.root.after(0, lambda l=line: self.debug_text.insert(tk.END, f"{l.strip()}\n", "info"))
+                        chunks.append((f"{line.strip()}\n", "info"))
 
                 if result.returncode == 0:
-                    self.root.after(0, lambda: self.debug_status_label.config(text="Gather complete"))
+                    status = "Gather complete"
                 else:
-                    self.root.after(0, lambda: self.debug_text.insert(
-                        tk.END, f"gatherdebug.sh failed (rc={result.returncode})\n", "error"))
-                    self.root.after(0, lambda: self.debug_status_label.config(text="Gather failed"))
+                    chunks.append((f"gatherdebug.sh failed (rc={result.returncode})\n", "error"))
+                    status = "Gather failed"
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self.debug_text.insert(
-                    tk.END, "gatherdebug.sh timed out (5m)\n", "error"))
-                self.root.after(0, lambda: self.debug_status_label.config(text="Gather timeout"))
+                chunks.append(("gatherdebug.sh timed out (5m)\n", "error"))
+                status = "Gather timeout"
             except Exception as e:
-                self.root.after(0, lambda: self.debug_text.insert(
-                    tk.END, f"Error: {e}\n", "error"))
+                chunks.append((f"Error: {e}\n", "error"))
+            self.root.after(0, self._finish_gather, chunks, status)
 
         threading.Thread(target=do_gather, daemon=True).start()
 
+    def _finish_gather(self, chunks, status):
+        """Apply gatherdebug.sh results on the Tk thread"""
+        if chunks:
+            self._write_text(self.debug_text, chunks, replace=False)
+        if status:
+            self.debug_status_label.config(text=status)
+
     def start_event_streamer(self):
         """Start background thread for fast event polling"""
         def stream_events():
             self.event_streamer_running = True
             log("Event streamer started")
+            etag = None
+            last_digest = None
+            delay = EVENT_POLL_INTERVAL
             while self.event_streamer_running:
+                new_count = 0
                 try:
-                    token = get_auth_token()
+                    token = self._current_token()
                     if not token or not self.cluster_id:
                         log(f"Event streamer waiting: token={bool(token)}, cluster_id={self.cluster_id}")
                         time.sleep(EVENT_POLL_INTERVAL)
                         continue
 
                     headers = {"Authorization": token}
-                    resp = requests.get(
+                    if etag:
+                        headers["If-None-Match"] = etag
+                    resp = self.session.get(
                         f"{API_URL}/events",
                         params={"cluster_id": self.cluster_id},
                         headers=headers,
-                        timeout=5,
-                        verify=False
+                        timeout=5
                     )
 
                     if resp.status_code == 200:
-                        events = resp.json()
-                        new_count = 0
-                        for event in events:
-                            event_id = event.get("event_id")
-                            if event_id and event_id not in self.seen_event_ids:
-                                self.seen_event_ids.add(event_id)
+                        etag = resp.headers.get("ETag")
+                        # Unchanged body (server without ETags): nothing to parse
+                        digest = hash(resp.content)
+                        if digest != last_digest:
+                            last_digest = digest
+                            for event in json_loads(resp.content):
+                                event_id = event.get("event_id")
+                                if not event_id:
+                                    continue
+                                if event_id in self.seen_event_ids:
+                                    # Still listed by the API: keep it from being evicted
+                                    self.seen_event_ids.move_to_end(event_id)
+                                    continue
+                                self.seen_event_ids[event_id] = None
+                                if len(self.seen_event_ids) > SEEN_EVENTS_LIMIT:
+                                    self.seen_event_ids.popitem(last=False)
                                 msg = event.get("message", "")
                                 severity = event.get("severity", "info")
                                 log_event(msg, severity)
                                 new_count += 1
                         if new_count > 0:
                             log(f"Event streamer: {new_count} new events")
-                    else:
+                    elif resp.status_code != 304:
                         log(f"Event streamer: API returned {resp.status_code}")
+                        if resp.status_code == 401:
+                            self._invalidate_token()
 
                 except Exception as e:
                     log(f"Event streamer error: {e}")
 
-                time.sleep(EVENT_POLL_INTERVAL)
+                # Back off while the event list is quiet, snap back once events arrive
+                delay = EVENT_POLL_INTERVAL if new_count else min(delay * 2, EVENT_POLL_MAX_INTERVAL)
+                time.sleep(delay)
 
         thread = threading.Thread(target=stream_events, daemon=True)
         thread.start()
 
 
 def main():
-    # Suppress SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
+    os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
     root = tk.Tk()
     app = AgentMonitor(root)
     root.mainloop()